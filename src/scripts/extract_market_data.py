@@ -6,14 +6,16 @@ import sys
 
 sys.path.append(str(Path(__file__).parent))
 from utils.data_cleaner import standardize_date, clean_numeric_column
+from utils.excel_parser import HAS_CALAMINE
 
 
 def process_market_data(input_file: str, output_dir: str) -> dict:
-    
+
     print(f"Processing market data: {input_file}")
-    
-    
-    df = pd.read_excel(input_file, sheet_name=0)
+
+
+    engine = 'calamine' if HAS_CALAMINE else None
+    df = pd.read_excel(input_file, sheet_name=0, engine=engine)
     
     
     df.columns = df.columns.str.lower().str.replace('/', '_').str.replace(' ', '_')
@@ -0,0 +1,27 @@
+
+
+# Generated by tools/generate_sheet_map.py - do not edit by hand.
+# Regenerate after new filings are added under data/raw/.
+
+SHEET_MAP = {
+    '10q': {
+        'balance_sheet': {'part i  financial informat', 'balances', 'balances-1', 'unaudited consolidated bal', 'consolidated balance sheets'},
+        'income_statement': {'unaudited consolidated sta', 'unaudited consolidated sta-1', 'unaudited consolidated sta-2', 'operations'},
+        'cash_flow': {'cash flows'},
+        'stockholders_equity': {'equity', 'equity-1', 'equity-2', 'equity-3'},
+        'revenue_breakdown': {'disaggregation of revenue', 'revenue'},
+        'earnings_per_share': {'note 3 earnings per share'},
+    },
+    '8k': {
+        'payment_schedule': set(),
+        'signatures': {'signature page follows', 'signature page follows-1', 'signature page follows-2', 'signature pages follow', 'signature', 'signature-1', 'signatures'},
+        'exhibits': {'d exhibits', 'exhibit b', 'exhibit b-1', 'exhibit b-2'},
+    },
+    'def14a': {
+        'executive_compensation': {'summary compensation', 'director compensation'},
+        'director_compensation': {'director compensation'},
+        'beneficial_ownership': set(),
+        'audit_fees': {'audit fees'},
+        'stock_options': set(),
+    },
+}
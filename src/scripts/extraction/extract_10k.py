@@ -2,27 +2,32 @@
 
 import pandas as pd
 from pathlib import Path
+import logging
 import sys
 from typing import Dict, List, Optional
 
 sys.path.append(str(Path(__file__).parent.parent))
 from utils.excel_parser import (get_filing_metadata, extract_table_from_sheet,
-                                find_sheets_by_keyword, get_sheet_names)
+                                find_sheets_by_keyword, find_first_sheet_by_keyword,
+                                get_sheet_names, table_has_data)
 from utils.data_cleaner import clean_financial_table
+from utils.file_index import find_files
+
+log = logging.getLogger(__name__)
 
 
 def extract_revenue_model(file_path: str) -> Optional[pd.DataFrame]:
     
     sheet_keywords = ['revenue model', 'our revenue model']
-    matching_sheets = find_sheets_by_keyword(file_path, sheet_keywords)
+    sheet_name = find_first_sheet_by_keyword(file_path, sheet_keywords)
     
-    if not matching_sheets:
+    if sheet_name is None:
         return None
     
-    print(f"  Extracting revenue model from: {matching_sheets[0]}")
-    df = extract_table_from_sheet(file_path, matching_sheets[0], header_rows=1)
+    log.info(f"  Extracting revenue model from: {sheet_name}")
+    df = extract_table_from_sheet(file_path, sheet_name, header_rows=1)
     
-    if df.empty:
+    if not table_has_data(df):
         return None
     
     return clean_financial_table(df)
@@ -31,15 +36,15 @@ def extract_revenue_model(file_path: str) -> Optional[pd.DataFrame]:
 def extract_patents(file_path: str) -> Optional[pd.DataFrame]:
     
     sheet_keywords = ['patents', 'patent']
-    matching_sheets = find_sheets_by_keyword(file_path, sheet_keywords)
+    sheet_name = find_first_sheet_by_keyword(file_path, sheet_keywords)
     
-    if not matching_sheets:
+    if sheet_name is None:
         return None
     
-    print(f"  Extracting patents from: {matching_sheets[0]}")
-    df = extract_table_from_sheet(file_path, matching_sheets[0], header_rows=1)
+    log.info(f"  Extracting patents from: {sheet_name}")
+    df = extract_table_from_sheet(file_path, sheet_name, header_rows=1)
     
-    if df.empty:
+    if not table_has_data(df):
         return None
     
     return clean_financial_table(df)
@@ -48,15 +53,15 @@ def extract_patents(file_path: str) -> Optional[pd.DataFrame]:
 def extract_trademarks(file_path: str) -> Optional[pd.DataFrame]:
     
     sheet_keywords = ['trademarks', 'trademark']
-    matching_sheets = find_sheets_by_keyword(file_path, sheet_keywords)
+    sheet_name = find_first_sheet_by_keyword(file_path, sheet_keywords)
     
-    if not matching_sheets:
+    if sheet_name is None:
         return None
     
-    print(f"  Extracting trademarks from: {matching_sheets[0]}")
-    df = extract_table_from_sheet(file_path, matching_sheets[0], header_rows=1)
+    log.info(f"  Extracting trademarks from: {sheet_name}")
+    df = extract_table_from_sheet(file_path, sheet_name, header_rows=1)
     
-    if df.empty:
+    if not table_has_data(df):
         return None
     
     return clean_financial_table(df)
@@ -65,15 +70,15 @@ def extract_trademarks(file_path: str) -> Optional[pd.DataFrame]:
 def extract_employees(file_path: str) -> Optional[pd.DataFrame]:
     
     sheet_keywords = ['employees', 'employee']
-    matching_sheets = find_sheets_by_keyword(file_path, sheet_keywords)
+    sheet_name = find_first_sheet_by_keyword(file_path, sheet_keywords)
     
-    if not matching_sheets:
+    if sheet_name is None:
         return None
     
-    print(f"  Extracting employees from: {matching_sheets[0]}")
-    df = extract_table_from_sheet(file_path, matching_sheets[0], header_rows=1)
+    log.info(f"  Extracting employees from: {sheet_name}")
+    df = extract_table_from_sheet(file_path, sheet_name, header_rows=1)
     
-    if df.empty:
+    if not table_has_data(df):
         return None
     
     return clean_financial_table(df)
@@ -82,15 +87,15 @@ def extract_employees(file_path: str) -> Optional[pd.DataFrame]:
 def extract_properties(file_path: str) -> Optional[pd.DataFrame]:
     
     sheet_keywords = ['properties', 'property', 'item 2 properties']
-    matching_sheets = find_sheets_by_keyword(file_path, sheet_keywords)
+    sheet_name = find_first_sheet_by_keyword(file_path, sheet_keywords)
     
-    if not matching_sheets:
+    if sheet_name is None:
         return None
     
-    print(f"  Extracting properties from: {matching_sheets[0]}")
-    df = extract_table_from_sheet(file_path, matching_sheets[0], header_rows=1)
+    log.info(f"  Extracting properties from: {sheet_name}")
+    df = extract_table_from_sheet(file_path, sheet_name, header_rows=1)
     
-    if df.empty:
+    if not table_has_data(df):
         return None
     
     return clean_financial_table(df)
@@ -99,15 +104,15 @@ def extract_properties(file_path: str) -> Optional[pd.DataFrame]:
 def extract_compensation(file_path: str) -> Optional[pd.DataFrame]:
     
     sheet_keywords = ['summary compensation', 'compensation', 'executive compensation']
-    matching_sheets = find_sheets_by_keyword(file_path, sheet_keywords)
+    sheet_name = find_first_sheet_by_keyword(file_path, sheet_keywords)
     
-    if not matching_sheets:
+    if sheet_name is None:
         return None
     
-    print(f"  Extracting compensation from: {matching_sheets[0]}")
-    df = extract_table_from_sheet(file_path, matching_sheets[0], header_rows=1)
+    log.info(f"  Extracting compensation from: {sheet_name}")
+    df = extract_table_from_sheet(file_path, sheet_name, header_rows=1)
     
-    if df.empty:
+    if not table_has_data(df):
         return None
     
     return clean_financial_table(df)
@@ -116,15 +121,15 @@ def extract_compensation(file_path: str) -> Optional[pd.DataFrame]:
 def extract_ownership(file_path: str) -> Optional[pd.DataFrame]:
     
     sheet_keywords = ['ownership', 'security ownership', 'item 12 security ownership']
-    matching_sheets = find_sheets_by_keyword(file_path, sheet_keywords)
+    sheet_name = find_first_sheet_by_keyword(file_path, sheet_keywords)
     
-    if not matching_sheets:
+    if sheet_name is None:
         return None
     
-    print(f"  Extracting ownership from: {matching_sheets[0]}")
-    df = extract_table_from_sheet(file_path, matching_sheets[0], header_rows=1)
+    log.info(f"  Extracting ownership from: {sheet_name}")
+    df = extract_table_from_sheet(file_path, sheet_name, header_rows=1)
     
-    if df.empty:
+    if not table_has_data(df):
         return None
     
     return clean_financial_table(df)
@@ -141,9 +146,9 @@ def extract_balance_sheet(file_path: str) -> Optional[pd.DataFrame]:
     
     for sheet in matching_sheets:
         if 'balance' in sheet.lower() or 'assets' in sheet.lower():
-            print(f"  Extracting balance sheet from: {sheet}")
+            log.info(f"  Extracting balance sheet from: {sheet}")
             df = extract_table_from_sheet(file_path, sheet, header_rows=2)
-            if not df.empty:
+            if table_has_data(df):
                 return clean_financial_table(df, in_thousands=True)
     
     return None
@@ -159,9 +164,9 @@ def extract_income_statement(file_path: str) -> Optional[pd.DataFrame]:
     
     for sheet in matching_sheets:
         if 'operations' in sheet.lower() and 'cash' not in sheet.lower():
-            print(f"  Extracting income statement from: {sheet}")
+            log.info(f"  Extracting income statement from: {sheet}")
             df = extract_table_from_sheet(file_path, sheet, header_rows=2)
-            if not df.empty:
+            if table_has_data(df):
                 return clean_financial_table(df, in_thousands=True)
     
     return None
@@ -169,7 +174,7 @@ def extract_income_statement(file_path: str) -> Optional[pd.DataFrame]:
 
 def process_10k_file(file_path: str, output_dir: str) -> Dict[str, str]:
     
-    print(f"\nProcessing 10-K: {Path(file_path).name}")
+    log.info(f"\nProcessing 10-K: {Path(file_path).name}")
     
     metadata = get_filing_metadata(file_path)
     filing_date = metadata.get('filing_date', 'unknown').replace('-', '')
@@ -196,9 +201,9 @@ def process_10k_file(file_path: str, output_dir: str) -> Dict[str, str]:
                 output_file = f"{output_dir}/10k_{name}_{filing_date}.csv"
                 df.to_csv(output_file, index=False)
                 results['files_created'].append(output_file)
-                print(f"  ✓ Saved {name}")
+                log.info(f"  ✓ Saved {name}")
         except Exception as e:
-            print(f"  ✗ Error extracting {name}: {e}")
+            log.error(f"  ✗ Error extracting {name}: {e}")
     
     return results
 
@@ -210,10 +215,10 @@ def process_all_10k_files(input_dir: str, output_dir: str) -> List[Dict]:
     output_path.mkdir(parents=True, exist_ok=True)
     
     
-    files_10k = list(input_path.glob('**/*Annual report*.xlsx'))
+    files_10k = find_files(input_dir, '*Annual report*.xlsx')
     
-    print(f"\nProcessing {len(files_10k)} 10-K files...")
-    print("=" * 80)
+    log.info(f"\nProcessing {len(files_10k)} 10-K files...")
+    log.info("=" * 80)
     
     results = []
     for file_path in files_10k:
@@ -221,17 +226,20 @@ def process_all_10k_files(input_dir: str, output_dir: str) -> List[Dict]:
             result = process_10k_file(str(file_path), str(output_path))
             results.append(result)
         except Exception as e:
-            print(f"  Error processing {file_path.name}: {e}")
+            log.error(f"  Error processing {file_path.name}: {e}")
             results.append({'status': 'error', 'file': str(file_path), 'error': str(e)})
     
     successful = sum(1 for r in results if r.get('status') == 'success')
-    print(f"\n{'=' * 80}")
-    print(f"10-K Processing Complete: {successful}/{len(files_10k)} successful")
+    log.info(f"\n{'=' * 80}")
+    log.info(f"10-K Processing Complete: {successful}/{len(files_10k)} successful")
     
     return results
 
 
 if __name__ == '__main__':
+    from utils.log_setup import setup_basic_logging
+    setup_basic_logging()
+
     base_dir = Path(__file__).parent.parent.parent.parent
     input_dir = base_dir / 'data' / 'raw' / 'annual reports'
     output_dir = base_dir / 'data' / 'processed' / 'annual reports'
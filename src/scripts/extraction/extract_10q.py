@@ -1,255 +1,221 @@
 
 
+import openpyxl
 import pandas as pd
 from pathlib import Path
+import logging
 import sys
 from typing import Dict, List, Optional
 
 sys.path.append(str(Path(__file__).parent.parent))
-from utils.excel_parser import (get_filing_metadata, extract_table_from_sheet,
-                                find_sheets_by_keyword, get_sheet_names)
-from utils.data_cleaner import clean_financial_table, standardize_date
-
-
-def extract_balance_sheet(file_path: str) -> Optional[pd.DataFrame]:
-    
-    
-    priority_keywords = ['part i  financial informat', 'unaudited consolidated bal', 'consolidated balance sheets']
-    matching_sheets = find_sheets_by_keyword(file_path, priority_keywords)
-    
-    
-    if not matching_sheets:
-        sheet_keywords = ['balance', 'assets']
-        matching_sheets = find_sheets_by_keyword(file_path, sheet_keywords)
-    
-    if not matching_sheets:
-        print("  No balance sheet found")
+from utils.excel_parser import (get_filing_metadata, extract_table_from_worksheet,
+                                first_sheet_from_index, index_sheets_by_keyword,
+                                list_sheet_names_lower, prefetch_workbooks,
+                                table_has_data)
+from utils.batch import dask_map
+from utils.data_cleaner import clean_financial_tables
+from utils.io_utils import write_csv
+from utils.file_index import find_files
+
+log = logging.getLogger(__name__)
+
+try:
+    from extraction._specialized_sheets import SHEET_MAP
+    SPECIALIZED_SHEETS = SHEET_MAP.get('10q', {})
+except ImportError:
+    SPECIALIZED_SHEETS = {}
+
+
+BALANCE_PRIORITY_KEYWORDS = ['part i  financial informat', 'unaudited consolidated bal',
+                             'consolidated balance sheets']
+BALANCE_FALLBACK_KEYWORDS = ['balance', 'assets']
+INCOME_KEYWORDS = ['operations', 'income', 'statement of operations',
+                   'unaudited consolidated sta', 'unaudited statements']
+CASH_FLOW_KEYWORDS = ['cash flow', 'cash', 'consolidated statements of cash']
+EQUITY_KEYWORDS = ['equity', 'stockholders', 'shareholders',
+                   'consolidated statements of stockholders']
+REVENUE_KEYWORDS = ['revenue', 'disaggregation', 'disaggregation of revenue']
+EPS_KEYWORDS = ['earnings per share', 'eps', 'note 3 earnings']
+
+ALL_SHEET_KEYWORDS = (BALANCE_PRIORITY_KEYWORDS + BALANCE_FALLBACK_KEYWORDS +
+                      INCOME_KEYWORDS + CASH_FLOW_KEYWORDS + EQUITY_KEYWORDS +
+                      REVENUE_KEYWORDS + EPS_KEYWORDS)
+
+
+def specialized_sheet(section: str, sheet_names) -> Optional[str]:
+
+    known = SPECIALIZED_SHEETS.get(section)
+    if not known:
         return None
-    
-    
-    sheet_name = matching_sheets[0]
-    print(f"  Extracting balance sheet from: {sheet_name}")
-    
-    df = extract_table_from_sheet(file_path, sheet_name, header_rows=2)
-    
-    if df.empty:
-        return None
-    
-    
-    df = clean_financial_table(df, in_thousands=True)
-    
-    return df
-
-
-def extract_income_statement(file_path: str) -> Optional[pd.DataFrame]:
-    
-    sheet_keywords = ['operations', 'income', 'statement of operations', 
-                     'unaudited consolidated sta', 'unaudited statements']
-    matching_sheets = find_sheets_by_keyword(file_path, sheet_keywords)
-    
-    if not matching_sheets:
-        print("  No income statement found")
-        return None
-    
-    
-    for sheet in matching_sheets:
-        if 'cash' not in sheet.lower() and 'equity' not in sheet.lower():
-            sheet_name = sheet
-            break
-    else:
-        sheet_name = matching_sheets[0]
-    
-    print(f"  Extracting income statement from: {sheet_name}")
-    
-    df = extract_table_from_sheet(file_path, sheet_name, header_rows=2)
-    
-    if df.empty:
-        return None
-    
-    df = clean_financial_table(df, in_thousands=True)
-    
-    return df
-
-
-def extract_cash_flow(file_path: str) -> Optional[pd.DataFrame]:
-    
-    sheet_keywords = ['cash flow', 'cash', 'consolidated statements of cash']
-    matching_sheets = find_sheets_by_keyword(file_path, sheet_keywords)
-    
-    if not matching_sheets:
-        print("  No cash flow statement found")
-        return None
-    
-    sheet_name = matching_sheets[0]
-    print(f"  Extracting cash flow from: {sheet_name}")
-    
-    df = extract_table_from_sheet(file_path, sheet_name, header_rows=2)
-    
-    if df.empty:
-        return None
-    
-    df = clean_financial_table(df, in_thousands=True)
-    
-    return df
-
-
-def extract_stockholders_equity(file_path: str) -> Optional[pd.DataFrame]:
-    
-    sheet_keywords = ['equity', 'stockholders', 'shareholders', 
-                     'consolidated statements of stockholders']
-    matching_sheets = find_sheets_by_keyword(file_path, sheet_keywords)
-    
-    if not matching_sheets:
-        print("  No stockholders' equity statement found")
-        return None
-    
-    sheet_name = matching_sheets[0]
-    print(f"  Extracting stockholders' equity from: {sheet_name}")
-    
-    df = extract_table_from_sheet(file_path, sheet_name, header_rows=2)
-    
-    if df.empty:
-        return None
-    
-    df = clean_financial_table(df, in_thousands=True)
-    
-    return df
-
-
-def extract_revenue_breakdown(file_path: str) -> Optional[pd.DataFrame]:
-    
-    sheet_keywords = ['revenue', 'disaggregation', 'disaggregation of revenue']
-    matching_sheets = find_sheets_by_keyword(file_path, sheet_keywords)
-    
-    if not matching_sheets:
-        return None
-    
-    sheet_name = matching_sheets[0]
-    print(f"  Extracting revenue breakdown from: {sheet_name}")
-    
-    df = extract_table_from_sheet(file_path, sheet_name, header_rows=1)
-    
-    if df.empty:
-        return None
-    
-    df = clean_financial_table(df, in_thousands=True)
-    
-    return df
-
-
-def extract_earnings_per_share(file_path: str) -> Optional[pd.DataFrame]:
-    
-    sheet_keywords = ['earnings per share', 'eps', 'note 3 earnings']
-    matching_sheets = find_sheets_by_keyword(file_path, sheet_keywords)
-    
-    if not matching_sheets:
-        return None
-    
-    sheet_name = matching_sheets[0]
-    print(f"  Extracting EPS from: {sheet_name}")
-    
-    df = extract_table_from_sheet(file_path, sheet_name, header_rows=1)
-    
-    if df.empty:
-        return None
-    
-    df = clean_financial_table(df, in_thousands=True)
-    
-    return df
 
+    for sheet_name in sheet_names:
+        if sheet_name in known:
+            return sheet_name
+
+    return None
+
+
+def resolve_balance_sheet(sheet_hits: Dict[str, set]) -> Optional[str]:
+
+    sheet_name = first_sheet_from_index(sheet_hits, BALANCE_PRIORITY_KEYWORDS)
+
+    if sheet_name is None:
+        sheet_name = first_sheet_from_index(sheet_hits, BALANCE_FALLBACK_KEYWORDS)
+
+    return sheet_name
+
+
+def resolve_income_statement(sheet_hits: Dict[str, set]) -> Optional[str]:
+
+    sheet_name = first_sheet_from_index(sheet_hits, INCOME_KEYWORDS,
+                                        exclude=('cash', 'equity'))
+
+    if sheet_name is None:
+        sheet_name = first_sheet_from_index(sheet_hits, INCOME_KEYWORDS)
+
+    return sheet_name
+
+
+def resolve_cash_flow(sheet_hits: Dict[str, set]) -> Optional[str]:
+
+    return first_sheet_from_index(sheet_hits, CASH_FLOW_KEYWORDS)
+
+
+def resolve_stockholders_equity(sheet_hits: Dict[str, set]) -> Optional[str]:
+
+    return first_sheet_from_index(sheet_hits, EQUITY_KEYWORDS)
+
+
+def resolve_revenue_breakdown(sheet_hits: Dict[str, set]) -> Optional[str]:
+
+    return first_sheet_from_index(sheet_hits, REVENUE_KEYWORDS)
+
+
+def resolve_earnings_per_share(sheet_hits: Dict[str, set]) -> Optional[str]:
+
+    return first_sheet_from_index(sheet_hits, EPS_KEYWORDS)
+
+
+SECTIONS = [
+    ('balance_sheet', 'balance sheet', resolve_balance_sheet, 2,
+     'No balance sheet found'),
+    ('income_statement', 'income statement', resolve_income_statement, 2,
+     'No income statement found'),
+    ('cash_flow', 'cash flow', resolve_cash_flow, 2,
+     'No cash flow statement found'),
+    ('stockholders_equity', "stockholders' equity", resolve_stockholders_equity, 2,
+     "No stockholders' equity statement found"),
+    ('revenue_breakdown', 'revenue breakdown', resolve_revenue_breakdown, 1, None),
+    ('earnings_per_share', 'EPS', resolve_earnings_per_share, 1, None),
+]
+
+
+def process_10q_file(file_path: str, output_dir: str,
+                     workbook=None) -> Dict[str, str]:
+
+    log.info(f"\nProcessing 10-Q: {Path(file_path).name}")
 
-def process_10q_file(file_path: str, output_dir: str) -> Dict[str, str]:
-    
-    print(f"\nProcessing 10-Q: {Path(file_path).name}")
-    
     metadata = get_filing_metadata(file_path)
     filing_date = metadata.get('filing_date', 'unknown').replace('-', '')
-    
+
     results = {'status': 'success', 'metadata': metadata, 'files_created': []}
-    
-    
-    balance_df = extract_balance_sheet(file_path)
-    if balance_df is not None and not balance_df.empty:
-        output_file = f"{output_dir}/10q_balance_sheet_{filing_date}.csv"
-        balance_df.to_csv(output_file, index=False)
-        results['files_created'].append(output_file)
-        print(f"  ✓ Saved balance sheet")
-    
-    
-    income_df = extract_income_statement(file_path)
-    if income_df is not None and not income_df.empty:
-        output_file = f"{output_dir}/10q_income_statement_{filing_date}.csv"
-        income_df.to_csv(output_file, index=False)
-        results['files_created'].append(output_file)
-        print(f"  ✓ Saved income statement")
-    
-    
-    cashflow_df = extract_cash_flow(file_path)
-    if cashflow_df is not None and not cashflow_df.empty:
-        output_file = f"{output_dir}/10q_cash_flow_{filing_date}.csv"
-        cashflow_df.to_csv(output_file, index=False)
-        results['files_created'].append(output_file)
-        print(f"  ✓ Saved cash flow")
-    
-    
-    equity_df = extract_stockholders_equity(file_path)
-    if equity_df is not None and not equity_df.empty:
-        output_file = f"{output_dir}/10q_stockholders_equity_{filing_date}.csv"
-        equity_df.to_csv(output_file, index=False)
-        results['files_created'].append(output_file)
-        print(f"  ✓ Saved stockholders' equity")
-    
-    
-    revenue_df = extract_revenue_breakdown(file_path)
-    if revenue_df is not None and not revenue_df.empty:
-        output_file = f"{output_dir}/10q_revenue_breakdown_{filing_date}.csv"
-        revenue_df.to_csv(output_file, index=False)
-        results['files_created'].append(output_file)
-        print(f"  ✓ Saved revenue breakdown")
-    
-    
-    eps_df = extract_earnings_per_share(file_path)
-    if eps_df is not None and not eps_df.empty:
-        output_file = f"{output_dir}/10q_earnings_per_share_{filing_date}.csv"
-        eps_df.to_csv(output_file, index=False)
-        results['files_created'].append(output_file)
-        print(f"  ✓ Saved EPS data")
-    
+
+
+    if workbook is None:
+        workbook = openpyxl.load_workbook(file_path, data_only=True)
+    sheet_hits = index_sheets_by_keyword(list_sheet_names_lower(workbook),
+                                         ALL_SHEET_KEYWORDS)
+
+    try:
+
+        sheet_map = {}
+        for section, label, resolver, header_rows, missing_message in SECTIONS:
+            sheet_name = specialized_sheet(section, sheet_hits) or resolver(sheet_hits)
+            if sheet_name is None:
+                if missing_message:
+                    log.info(f"  {missing_message}")
+                continue
+            sheet_map[section] = (label, sheet_name, header_rows)
+
+
+        extracted = {}
+        raw_tables = {}
+        for section, (label, sheet_name, header_rows) in sheet_map.items():
+            log.info(f"  Extracting {label} from: {sheet_name}")
+
+            key = (sheet_name, header_rows)
+            if key not in extracted:
+                extracted[key] = extract_table_from_worksheet(workbook[sheet_name],
+                                                              header_rows=header_rows)
+
+            if table_has_data(extracted[key]):
+                raw_tables[section] = extracted[key]
+
+
+        cleaned_tables = clean_financial_tables(raw_tables, in_thousands=True)
+
+        for section, df in cleaned_tables.items():
+            if df.empty:
+                continue
+
+            output_file = f"{output_dir}/10q_{section}_{filing_date}.csv"
+            write_csv(df, output_file)
+            results['files_created'].append(output_file)
+            log.info(f"  ✓ Saved {sheet_map[section][0]}")
+    finally:
+        workbook.close()
+
     return results
 
 
+def _safe_process_10q(file_path, output_dir: str) -> Dict:
+
+    try:
+        return process_10q_file(str(file_path), output_dir)
+    except Exception as e:
+        log.error(f"  Error processing {Path(file_path).name}: {e}")
+        return {'status': 'error', 'file': str(file_path), 'error': str(e)}
+
+
 def process_all_10q_files(input_dir: str, output_dir: str) -> List[Dict]:
-    
+
     input_path = Path(input_dir)
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
-    
-    
-    files_10q = list(input_path.glob('**/*quarterly reports*.xlsx'))
-    
-    print(f"\nProcessing {len(files_10q)} 10-Q files...")
-    print("=" * 80)
-    
-    results = []
-    for file_path in files_10q:
-        try:
-            result = process_10q_file(str(file_path), str(output_path))
-            results.append(result)
-        except Exception as e:
-            print(f"  Error processing {file_path.name}: {e}")
-            results.append({'status': 'error', 'file': str(file_path), 'error': str(e)})
-    
+
+
+    files_10q = find_files(input_dir, '*quarterly reports*.xlsx')
+
+    log.info(f"\nProcessing {len(files_10q)} 10-Q files...")
+    log.info("=" * 80)
+
+    results = dask_map(_safe_process_10q, files_10q, str(output_path))
+    if results is None:
+
+        results = []
+        for file_path, workbook_future in prefetch_workbooks(files_10q):
+            try:
+                result = process_10q_file(str(file_path), str(output_path),
+                                          workbook=workbook_future.result())
+                results.append(result)
+            except Exception as e:
+                log.error(f"  Error processing {file_path.name}: {e}")
+                results.append({'status': 'error', 'file': str(file_path),
+                                'error': str(e)})
+
     successful = sum(1 for r in results if r.get('status') == 'success')
-    print(f"\n{'=' * 80}")
-    print(f"10-Q Processing Complete: {successful}/{len(files_10q)} successful")
-    
+    log.info(f"\n{'=' * 80}")
+    log.info(f"10-Q Processing Complete: {successful}/{len(files_10q)} successful")
+
     return results
 
 
 if __name__ == '__main__':
+    from utils.log_setup import setup_basic_logging
+    setup_basic_logging()
+
     base_dir = Path(__file__).parent.parent.parent.parent
     input_dir = base_dir / 'data' / 'raw' / 'quarterly reports'
     output_dir = base_dir / 'data' / 'processed' / 'quarterly reports'
-    
-    process_all_10q_files(str(input_dir), str(output_dir))
 
+    process_all_10q_files(str(input_dir), str(output_dir))
@@ -1,43 +1,77 @@
 
 
+import numpy as np
 import pandas as pd
+from functools import lru_cache
 from pathlib import Path
+import logging
 import sys
 from typing import Dict, List, Optional
 import re
 
 sys.path.append(str(Path(__file__).parent.parent))
 from utils.excel_parser import (get_filing_metadata, extract_table_from_sheet,
-                                get_sheet_names, read_excel_with_merged_cells)
+                                get_sheet_names, read_excel_with_merged_cells,
+                                table_has_data)
+from utils.batch import dask_map
 from utils.data_cleaner import clean_financial_table, clean_whitespace
+from utils.io_utils import write_csv
+from utils.file_index import find_files
+
+log = logging.getLogger(__name__)
+
+try:
+    import polars as pl
+    HAS_POLARS = True
+except ImportError:
+    HAS_POLARS = False
+
+
+_ITEM_RE = re.compile(r'item\s+(\d+(?:\.\d+)?)')
+
+
+@lru_cache(maxsize=64)
+def _cached_table(file_path: str, sheet_name: str, header_rows: int) -> pd.DataFrame:
+
+    return extract_table_from_sheet(file_path, sheet_name, header_rows=header_rows)
+
+
+def _extract_table(file_path: str, sheet_name: str,
+                   header_rows: int = 1) -> pd.DataFrame:
+
+
+    return _cached_table(file_path, sheet_name, header_rows).copy()
+
+
+def _count_numeric_cells(df: pd.DataFrame) -> int:
+
+    if HAS_POLARS:
+        try:
+            pdf = pl.from_pandas(df)
+            return int(sum(pdf[col].cast(pl.Float64, strict=False).is_not_null().sum()
+                           for col in pdf.columns))
+        except Exception:
+            pass
+
+    coerced = pd.to_numeric(pd.Series(df.values.ravel()), errors='coerce').to_numpy()
+    return int(np.isfinite(coerced).sum())
 
 
 def extract_8k_metadata(file_path: str) -> Dict[str, any]:
-    
+
     metadata = get_filing_metadata(file_path)
     sheet_names = get_sheet_names(file_path)
-    
+
     metadata['sheet_count'] = len(sheet_names)
     metadata['sheet_names'] = sheet_names
-    
-    
-    items_reported = []
-    
-    
-    item_patterns = [
-        r'item\s+(\d+\.\d+)',
-        r'item\s+(\d+)',
-    ]
-    
-    
-    for sheet_name in sheet_names:
-        for pattern in item_patterns:
-            matches = re.findall(pattern, sheet_name.lower())
-            items_reported.extend(matches)
-    
+
+
+    items_reported = {match for sheet_name in sheet_names
+                      for match in _ITEM_RE.findall(sheet_name.lower())}
+
     if items_reported:
-        metadata['items_reported'] = list(set(items_reported))
-    
+        metadata['items_reported'] = sorted(items_reported)
+
     return metadata
 
 
@@ -52,21 +86,21 @@ def extract_tables_from_8k(file_path: str) -> List[Dict]:
             continue
         
         try:
-            df = extract_table_from_sheet(file_path, sheet_name, header_rows=1)
+            df = _extract_table(file_path, sheet_name, header_rows=1)
             
             
             if not df.empty and len(df) > 2 and len(df.columns) > 1:
-                
-                numeric_count = sum(df.map(lambda x: isinstance(x, (int, float))).sum())
-                
-                if numeric_count > 3:  
+
+                numeric_count = _count_numeric_cells(df)
+
+                if numeric_count > 3:
                     df = clean_financial_table(df)
                     extracted_tables.append({
                         'sheet_name': sheet_name,
                         'data': df
                     })
         except Exception as e:
-            print(f"    Warning: Could not extract table from {sheet_name}: {e}")
+            log.warning(f"    Warning: Could not extract table from {sheet_name}: {e}")
             continue
     
     return extracted_tables
@@ -79,10 +113,10 @@ def extract_payment_schedule(file_path: str) -> Optional[pd.DataFrame]:
     for sheet_name in sheet_names:
         sheet_lower = sheet_name.lower()
         if any(keyword in sheet_lower for keyword in ['installment', 'payment', 'schedule', 'principal']):
-            print(f"  Found payment schedule: {sheet_name}")
-            df = extract_table_from_sheet(file_path, sheet_name, header_rows=1)
+            log.info(f"  Found payment schedule: {sheet_name}")
+            df = _extract_table(file_path, sheet_name, header_rows=1)
             
-            if not df.empty:
+            if table_has_data(df):
                 return clean_financial_table(df)
     
     return None
@@ -112,8 +146,8 @@ def extract_exhibit_info(file_path: str) -> List[Dict]:
     for sheet_name in sheet_names:
         if 'exhibit' in sheet_name.lower():
             try:
-                df = extract_table_from_sheet(file_path, sheet_name, header_rows=1)
-                if not df.empty:
+                df = _extract_table(file_path, sheet_name, header_rows=1)
+                if table_has_data(df):
                     exhibits.append({
                         'exhibit_name': sheet_name,
                         'data': clean_financial_table(df)
@@ -126,7 +160,7 @@ def extract_exhibit_info(file_path: str) -> List[Dict]:
 
 def process_8k_file(file_path: str, output_dir: str) -> Dict[str, str]:
     
-    print(f"\nProcessing 8-K: {Path(file_path).name}")
+    log.info(f"\nProcessing 8-K: {Path(file_path).name}")
     
     metadata = extract_8k_metadata(file_path)
     filing_date = metadata.get('filing_date', 'unknown').replace('-', '')
@@ -136,68 +170,79 @@ def process_8k_file(file_path: str, output_dir: str) -> Dict[str, str]:
     
     metadata_df = pd.DataFrame([metadata])
     output_file = f"{output_dir}/8k_metadata_{filing_date}.csv"
-    metadata_df.to_csv(output_file, index=False)
+    write_csv(metadata_df, output_file)
     results['files_created'].append(output_file)
-    print(f"  ✓ Saved metadata")
+    log.info(f"  ✓ Saved metadata")
     
     
     payment_df = extract_payment_schedule(file_path)
     if payment_df is not None and not payment_df.empty:
         output_file = f"{output_dir}/8k_payment_schedule_{filing_date}.csv"
-        payment_df.to_csv(output_file, index=False)
+        write_csv(payment_df, output_file)
         results['files_created'].append(output_file)
-        print(f"  ✓ Saved payment schedule")
+        log.info(f"  ✓ Saved payment schedule")
     
     
     tables = extract_tables_from_8k(file_path)
     for i, table_info in enumerate(tables):
         sheet_name = table_info['sheet_name'].replace(' ', '_').replace('/', '_')[:50]
         output_file = f"{output_dir}/8k_table_{filing_date}_{sheet_name}.csv"
-        table_info['data'].to_csv(output_file, index=False)
+        write_csv(table_info['data'], output_file)
         results['files_created'].append(output_file)
-        print(f"  ✓ Saved table from: {table_info['sheet_name']}")
+        log.info(f"  ✓ Saved table from: {table_info['sheet_name']}")
     
     
     exhibits = extract_exhibit_info(file_path)
     for i, exhibit_info in enumerate(exhibits):
         exhibit_name = exhibit_info['exhibit_name'].replace(' ', '_')[:50]
         output_file = f"{output_dir}/8k_exhibit_{filing_date}_{exhibit_name}.csv"
-        exhibit_info['data'].to_csv(output_file, index=False)
+        write_csv(exhibit_info['data'], output_file)
         results['files_created'].append(output_file)
-        print(f"  ✓ Saved exhibit: {exhibit_info['exhibit_name']}")
-    
+        log.info(f"  ✓ Saved exhibit: {exhibit_info['exhibit_name']}")
+
+
+    _cached_table.cache_clear()
+
     return results
 
 
+def _safe_process_8k(file_path, output_dir: str) -> Dict:
+
+    try:
+        return process_8k_file(str(file_path), output_dir)
+    except Exception as e:
+        log.error(f"  Error processing {Path(file_path).name}: {e}")
+        return {'status': 'error', 'file': str(file_path), 'error': str(e)}
+
+
 def process_all_8k_files(input_dir: str, output_dir: str) -> List[Dict]:
-    
+
     input_path = Path(input_dir)
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
-    
-    
-    files_8k = list(input_path.glob('**/*Current report*.xlsx'))
-    
-    print(f"\nProcessing {len(files_8k)} 8-K files...")
-    print("=" * 80)
-    
-    results = []
-    for file_path in files_8k:
-        try:
-            result = process_8k_file(str(file_path), str(output_path))
-            results.append(result)
-        except Exception as e:
-            print(f"  Error processing {file_path.name}: {e}")
-            results.append({'status': 'error', 'file': str(file_path), 'error': str(e)})
+
+
+    files_8k = find_files(input_dir, '*Current report*.xlsx')
+
+    log.info(f"\nProcessing {len(files_8k)} 8-K files...")
+    log.info("=" * 80)
+
+    results = dask_map(_safe_process_8k, files_8k, str(output_path))
+    if results is None:
+        results = [_safe_process_8k(file_path, str(output_path))
+                   for file_path in files_8k]
     
     successful = sum(1 for r in results if r.get('status') == 'success')
-    print(f"\n{'=' * 80}")
-    print(f"8-K Processing Complete: {successful}/{len(files_8k)} successful")
+    log.info(f"\n{'=' * 80}")
+    log.info(f"8-K Processing Complete: {successful}/{len(files_8k)} successful")
     
     return results
 
 
 if __name__ == '__main__':
+    from utils.log_setup import setup_basic_logging
+    setup_basic_logging()
+
     base_dir = Path(__file__).parent.parent.parent.parent
     input_dir = base_dir / 'data' / 'raw' / '8-k related'
     output_dir = base_dir / 'data' / 'processed' / '8-k related'
@@ -1,23 +1,57 @@
 
 
+import openpyxl
 import pandas as pd
 from pathlib import Path
+import logging
 import sys
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 sys.path.append(str(Path(__file__).parent.parent))
-from utils.excel_parser import (get_filing_metadata, extract_table_from_sheet,
-                                find_sheets_by_keyword, get_sheet_names)
+from utils.excel_parser import (get_filing_metadata, extract_table_from_worksheet,
+                                match_sheets_from_index, first_sheet_from_index,
+                                index_sheets_by_keyword, list_sheet_names_lower,
+                                table_has_data)
+from utils.batch import dask_map
 from utils.data_cleaner import clean_financial_table
+from utils.io_utils import write_csv
+from utils.file_index import find_files
 
+log = logging.getLogger(__name__)
 
-def extract_executive_compensation(file_path: str) -> Optional[pd.DataFrame]:
+
+EXEC_COMP_KEYWORDS = ['summary compensation', 'executive compensation', 'compensation']
+DIRECTOR_COMP_KEYWORDS = ['director compensation', 'director']
+OWNERSHIP_KEYWORDS = ['beneficial ownership', 'ownership', 'security ownership']
+AUDIT_FEES_KEYWORDS = ['audit fees', 'audit', 'fees']
+STOCK_OPTION_KEYWORDS = ['option grants', 'stock awards', 'option awards']
+
+_worksheet_memo: Dict[tuple, pd.DataFrame] = {}
+
+
+def _extract_worksheet(workbook, sheet_name: str,
+                       header_rows: int = 1) -> pd.DataFrame:
+
+
+    key = (id(workbook), sheet_name, header_rows)
+    if key not in _worksheet_memo:
+        _worksheet_memo[key] = extract_table_from_worksheet(workbook[sheet_name],
+                                                            header_rows=header_rows)
+
+    return _worksheet_memo[key].copy()
+
+
+ALL_SHEET_KEYWORDS = (EXEC_COMP_KEYWORDS + DIRECTOR_COMP_KEYWORDS +
+                      OWNERSHIP_KEYWORDS + AUDIT_FEES_KEYWORDS +
+                      STOCK_OPTION_KEYWORDS)
+
+
+def extract_executive_compensation(workbook, sheet_hits: Dict[str, set]) -> Optional[pd.DataFrame]:
     
-    sheet_keywords = ['summary compensation', 'executive compensation', 'compensation']
-    matching_sheets = find_sheets_by_keyword(file_path, sheet_keywords)
+    matching_sheets = match_sheets_from_index(sheet_hits, EXEC_COMP_KEYWORDS)
     
     if not matching_sheets:
-        print("  No executive compensation table found")
+        log.info("  No executive compensation table found")
         return None
     
     
@@ -28,11 +62,11 @@ def extract_executive_compensation(file_path: str) -> Optional[pd.DataFrame]:
     else:
         sheet_name = matching_sheets[0]
     
-    print(f"  Extracting executive compensation from: {sheet_name}")
+    log.info(f"  Extracting executive compensation from: {sheet_name}")
     
-    df = extract_table_from_sheet(file_path, sheet_name, header_rows=1)
+    df = _extract_worksheet(workbook, sheet_name, header_rows=1)
     
-    if df.empty:
+    if not table_has_data(df):
         return None
     
     df = clean_financial_table(df)
@@ -40,21 +74,19 @@ def extract_executive_compensation(file_path: str) -> Optional[pd.DataFrame]:
     return df
 
 
-def extract_director_compensation(file_path: str) -> Optional[pd.DataFrame]:
+def extract_director_compensation(workbook, sheet_hits: Dict[str, set]) -> Optional[pd.DataFrame]:
     
-    sheet_keywords = ['director compensation', 'director']
-    matching_sheets = find_sheets_by_keyword(file_path, sheet_keywords)
+    sheet_name = first_sheet_from_index(sheet_hits, DIRECTOR_COMP_KEYWORDS)
     
-    if not matching_sheets:
-        print("  No director compensation table found")
+    if sheet_name is None:
+        log.info("  No director compensation table found")
         return None
     
-    sheet_name = matching_sheets[0]
-    print(f"  Extracting director compensation from: {sheet_name}")
+    log.info(f"  Extracting director compensation from: {sheet_name}")
     
-    df = extract_table_from_sheet(file_path, sheet_name, header_rows=1)
+    df = _extract_worksheet(workbook, sheet_name, header_rows=1)
     
-    if df.empty:
+    if not table_has_data(df):
         return None
     
     df = clean_financial_table(df)
@@ -62,24 +94,20 @@ def extract_director_compensation(file_path: str) -> Optional[pd.DataFrame]:
     return df
 
 
-def extract_beneficial_ownership(file_path: str) -> Optional[pd.DataFrame]:
+def extract_beneficial_ownership(workbook, sheet_hits: Dict[str, set]) -> Optional[pd.DataFrame]:
     
-    sheet_keywords = ['beneficial ownership', 'ownership', 'security ownership']
-    matching_sheets = find_sheets_by_keyword(file_path, sheet_keywords)
+    sheet_name = first_sheet_from_index(sheet_hits, OWNERSHIP_KEYWORDS,
+                                        exclude=('compensation',))
     
-    
-    matching_sheets = [s for s in matching_sheets if 'compensation' not in s.lower()]
-    
-    if not matching_sheets:
-        print("  No beneficial ownership table found")
+    if sheet_name is None:
+        log.info("  No beneficial ownership table found")
         return None
     
-    sheet_name = matching_sheets[0]
-    print(f"  Extracting beneficial ownership from: {sheet_name}")
+    log.info(f"  Extracting beneficial ownership from: {sheet_name}")
     
-    df = extract_table_from_sheet(file_path, sheet_name, header_rows=1)
+    df = _extract_worksheet(workbook, sheet_name, header_rows=1)
     
-    if df.empty:
+    if not table_has_data(df):
         return None
     
     df = clean_financial_table(df)
@@ -87,21 +115,19 @@ def extract_beneficial_ownership(file_path: str) -> Optional[pd.DataFrame]:
     return df
 
 
-def extract_audit_fees(file_path: str) -> Optional[pd.DataFrame]:
+def extract_audit_fees(workbook, sheet_hits: Dict[str, set]) -> Optional[pd.DataFrame]:
     
-    sheet_keywords = ['audit fees', 'audit', 'fees']
-    matching_sheets = find_sheets_by_keyword(file_path, sheet_keywords)
+    sheet_name = first_sheet_from_index(sheet_hits, AUDIT_FEES_KEYWORDS)
     
-    if not matching_sheets:
-        print("  No audit fees table found")
+    if sheet_name is None:
+        log.info("  No audit fees table found")
         return None
     
-    sheet_name = matching_sheets[0]
-    print(f"  Extracting audit fees from: {sheet_name}")
+    log.info(f"  Extracting audit fees from: {sheet_name}")
     
-    df = extract_table_from_sheet(file_path, sheet_name, header_rows=1)
+    df = _extract_worksheet(workbook, sheet_name, header_rows=1)
     
-    if df.empty:
+    if not table_has_data(df):
         return None
     
     df = clean_financial_table(df)
@@ -109,20 +135,18 @@ def extract_audit_fees(file_path: str) -> Optional[pd.DataFrame]:
     return df
 
 
-def extract_stock_option_grants(file_path: str) -> Optional[pd.DataFrame]:
+def extract_stock_option_grants(workbook, sheet_hits: Dict[str, set]) -> Optional[pd.DataFrame]:
     
-    sheet_keywords = ['option grants', 'stock awards', 'option awards']
-    matching_sheets = find_sheets_by_keyword(file_path, sheet_keywords)
+    sheet_name = first_sheet_from_index(sheet_hits, STOCK_OPTION_KEYWORDS)
     
-    if not matching_sheets:
+    if sheet_name is None:
         return None
     
-    sheet_name = matching_sheets[0]
-    print(f"  Extracting stock options from: {sheet_name}")
+    log.info(f"  Extracting stock options from: {sheet_name}")
     
-    df = extract_table_from_sheet(file_path, sheet_name, header_rows=1)
+    df = _extract_worksheet(workbook, sheet_name, header_rows=1)
     
-    if df.empty:
+    if not table_has_data(df):
         return None
     
     df = clean_financial_table(df)
@@ -132,85 +156,102 @@ def extract_stock_option_grants(file_path: str) -> Optional[pd.DataFrame]:
 
 def process_def14a_file(file_path: str, output_dir: str) -> Dict[str, str]:
     
-    print(f"\nProcessing DEF 14A: {Path(file_path).name}")
+    log.info(f"\nProcessing DEF 14A: {Path(file_path).name}")
     
     metadata = get_filing_metadata(file_path)
     filing_date = metadata.get('filing_date', 'unknown').replace('-', '')
     
     results = {'status': 'success', 'metadata': metadata, 'files_created': []}
-    
-    
-    exec_comp_df = extract_executive_compensation(file_path)
-    if exec_comp_df is not None and not exec_comp_df.empty:
-        output_file = f"{output_dir}/def14a_executive_compensation_{filing_date}.csv"
-        exec_comp_df.to_csv(output_file, index=False)
-        results['files_created'].append(output_file)
-        print(f"  ✓ Saved executive compensation")
-    
-    
-    dir_comp_df = extract_director_compensation(file_path)
-    if dir_comp_df is not None and not dir_comp_df.empty:
-        output_file = f"{output_dir}/def14a_director_compensation_{filing_date}.csv"
-        dir_comp_df.to_csv(output_file, index=False)
-        results['files_created'].append(output_file)
-        print(f"  ✓ Saved director compensation")
-    
-    
-    ownership_df = extract_beneficial_ownership(file_path)
-    if ownership_df is not None and not ownership_df.empty:
-        output_file = f"{output_dir}/def14a_beneficial_ownership_{filing_date}.csv"
-        ownership_df.to_csv(output_file, index=False)
-        results['files_created'].append(output_file)
-        print(f"  ✓ Saved beneficial ownership")
-    
-    
-    audit_df = extract_audit_fees(file_path)
-    if audit_df is not None and not audit_df.empty:
-        output_file = f"{output_dir}/def14a_audit_fees_{filing_date}.csv"
-        audit_df.to_csv(output_file, index=False)
-        results['files_created'].append(output_file)
-        print(f"  ✓ Saved audit fees")
-    
-    
-    options_df = extract_stock_option_grants(file_path)
-    if options_df is not None and not options_df.empty:
-        output_file = f"{output_dir}/def14a_stock_options_{filing_date}.csv"
-        options_df.to_csv(output_file, index=False)
-        results['files_created'].append(output_file)
-        print(f"  ✓ Saved stock options")
-    
+
+
+    workbook = openpyxl.load_workbook(file_path, data_only=True)
+    sheet_hits = index_sheets_by_keyword(list_sheet_names_lower(workbook),
+                                         ALL_SHEET_KEYWORDS)
+
+    try:
+        exec_comp_df = extract_executive_compensation(workbook, sheet_hits)
+        if exec_comp_df is not None and not exec_comp_df.empty:
+            output_file = f"{output_dir}/def14a_executive_compensation_{filing_date}.csv"
+            write_csv(exec_comp_df, output_file)
+            results['files_created'].append(output_file)
+            log.info(f"  ✓ Saved executive compensation")
+    
+    
+        dir_comp_df = extract_director_compensation(workbook, sheet_hits)
+        if dir_comp_df is not None and not dir_comp_df.empty:
+            output_file = f"{output_dir}/def14a_director_compensation_{filing_date}.csv"
+            write_csv(dir_comp_df, output_file)
+            results['files_created'].append(output_file)
+            log.info(f"  ✓ Saved director compensation")
+    
+    
+        ownership_df = extract_beneficial_ownership(workbook, sheet_hits)
+        if ownership_df is not None and not ownership_df.empty:
+            output_file = f"{output_dir}/def14a_beneficial_ownership_{filing_date}.csv"
+            write_csv(ownership_df, output_file)
+            results['files_created'].append(output_file)
+            log.info(f"  ✓ Saved beneficial ownership")
+    
+    
+        audit_df = extract_audit_fees(workbook, sheet_hits)
+        if audit_df is not None and not audit_df.empty:
+            output_file = f"{output_dir}/def14a_audit_fees_{filing_date}.csv"
+            write_csv(audit_df, output_file)
+            results['files_created'].append(output_file)
+            log.info(f"  ✓ Saved audit fees")
+    
+    
+        options_df = extract_stock_option_grants(workbook, sheet_hits)
+        if options_df is not None and not options_df.empty:
+            output_file = f"{output_dir}/def14a_stock_options_{filing_date}.csv"
+            write_csv(options_df, output_file)
+            results['files_created'].append(output_file)
+            log.info(f"  ✓ Saved stock options")
+    
+    finally:
+        _worksheet_memo.clear()
+        workbook.close()
+
     return results
 
 
+def _safe_process_def14a(file_path, output_dir: str) -> Dict:
+
+    try:
+        return process_def14a_file(str(file_path), output_dir)
+    except Exception as e:
+        log.error(f"  Error processing {Path(file_path).name}: {e}")
+        return {'status': 'error', 'file': str(file_path), 'error': str(e)}
+
+
 def process_all_def14a_files(input_dir: str, output_dir: str) -> List[Dict]:
-    
+
     input_path = Path(input_dir)
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
-    
-    
-    files_def14a = list(input_path.glob('**/*proxy*.xlsx'))
-    
-    print(f"\nProcessing {len(files_def14a)} DEF 14A files...")
-    print("=" * 80)
-    
-    results = []
-    for file_path in files_def14a:
-        try:
-            result = process_def14a_file(str(file_path), str(output_path))
-            results.append(result)
-        except Exception as e:
-            print(f"  Error processing {file_path.name}: {e}")
-            results.append({'status': 'error', 'file': str(file_path), 'error': str(e)})
+
+
+    files_def14a = find_files(input_dir, '*proxy*.xlsx')
+
+    log.info(f"\nProcessing {len(files_def14a)} DEF 14A files...")
+    log.info("=" * 80)
+
+    results = dask_map(_safe_process_def14a, files_def14a, str(output_path))
+    if results is None:
+        results = [_safe_process_def14a(file_path, str(output_path))
+                   for file_path in files_def14a]
     
     successful = sum(1 for r in results if r.get('status') == 'success')
-    print(f"\n{'=' * 80}")
-    print(f"DEF 14A Processing Complete: {successful}/{len(files_def14a)} successful")
+    log.info(f"\n{'=' * 80}")
+    log.info(f"DEF 14A Processing Complete: {successful}/{len(files_def14a)} successful")
     
     return results
 
 
 if __name__ == '__main__':
+    from utils.log_setup import setup_basic_logging
+    setup_basic_logging()
+
     base_dir = Path(__file__).parent.parent.parent.parent
     input_dir = base_dir / 'data' / 'raw' / 'proxies and info statements'
     output_dir = base_dir / 'data' / 'processed' / 'proxies and info statements'
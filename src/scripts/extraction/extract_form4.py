@@ -1,59 +1,154 @@
 
 
+import logging
+import openpyxl
+import os
 import pandas as pd
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 import sys
 from typing import Dict, List, Optional
 
 
 sys.path.append(str(Path(__file__).parent.parent))
-from utils.excel_parser import (get_filing_metadata, extract_table_from_sheet, 
-                                get_sheet_names, read_excel_with_merged_cells)
+from utils.excel_parser import get_filing_metadata, extract_table_from_worksheet
 from utils.data_cleaner import (clean_numeric_column, standardize_date, 
                                clean_financial_table, clean_whitespace)
+from utils.file_index import find_files
+from utils.io_utils import write_csv, write_csv_with_constants, advise_willneed
+from utils.results import FilingResult
 
+log = logging.getLogger(__name__)
+
+
+OFFICER_TITLES = ('President', 'CEO', 'CFO', 'Director', 'Officer')
+
+_OFFICER_TITLE_RE = re.compile('|'.join(OFFICER_TITLES))
+
+_DATE_TRANS = str.maketrans({'-': ''})
+_NAME_TRANS = str.maketrans({' ': '_', '.': ''})
+
+NONDERIVATIVE_COLUMN_MAPPING = {
+    'title of security': 'security_title',
+    '1. title of security': 'security_title',
+    'transaction date': 'transaction_date',
+    '2. transaction date': 'transaction_date',
+    'transaction code': 'transaction_code',
+    '3. transaction code': 'transaction_code',
+    'code': 'transaction_code',
+    'amount': 'amount',
+    'shares': 'shares',
+    'price': 'price',
+    'price per share': 'price_per_share',
+    'securities acquired': 'securities_acquired',
+    'securities disposed': 'securities_disposed',
+    'amount of securities beneficially owned': 'securities_owned_after',
+    '5. amount of securities beneficially owned': 'securities_owned_after',
+    'ownership form': 'ownership_form',
+    '6. ownership form': 'ownership_form'
+}
+
+DERIVATIVE_COLUMN_MAPPING = {
+    'title of derivative security': 'derivative_title',
+    '1. title of derivative security': 'derivative_title',
+    'conversion or exercise price': 'exercise_price',
+    '2. conversion or exercise price': 'exercise_price',
+    'transaction date': 'transaction_date',
+    '3. transaction date': 'transaction_date',
+    'transaction code': 'transaction_code',
+    '4. transaction code': 'transaction_code',
+    'number of derivative securities': 'number_of_securities',
+    'date exercisable': 'date_exercisable',
+    'expiration date': 'expiration_date',
+    'title and amount of securities underlying': 'underlying_securities',
+    'price of derivative security': 'derivative_price'
+}
+
+
+def _compile_column_mapping(column_mapping: Dict[str, str]):
+
+    pattern = re.compile('|'.join(f'({re.escape(key)})' for key in column_mapping))
+    return pattern, list(column_mapping.values())
+
+
+_NONDERIVATIVE_PATTERN, _NONDERIVATIVE_TARGETS = \
+    _compile_column_mapping(NONDERIVATIVE_COLUMN_MAPPING)
+_DERIVATIVE_PATTERN, _DERIVATIVE_TARGETS = \
+    _compile_column_mapping(DERIVATIVE_COLUMN_MAPPING)
+
+
+def _rename_columns(df: pd.DataFrame, pattern, targets) -> pd.DataFrame:
+
+
+    rename = {}
+    taken = set()
+    for col in df.columns:
+        match = pattern.search(str(col).lower())
+        if match:
+            target = targets[match.lastindex - 1]
+            if target not in taken:
+                rename[col] = target
+                taken.add(target)
+
+    if rename:
+        df.rename(columns=rename, inplace=True)
+
+    return df
+
+
+def extract_reporting_person(workbook, sheet_name: str) -> Dict[str, str]:
+
+
+    name = None
+    title = None
+    relationship_flags = {}
+
+    for i, row in enumerate(workbook[sheet_name].iter_rows(max_row=20,
+                                                           values_only=True)):
+        cells = [val for val in row if isinstance(val, str)]
+        joined = ' '.join(cells)
+
+        if i == 0 or 'Name and Address of Reporting Person' in joined:
+            for val in cells:
+                if len(val) > 3 and 'Name and Address' not in val:
+                    name = val.strip()
+                    break
+
+        if 'Relationship of Reporting Person' in joined or \
+           'Director' in joined or 'Officer' in joined:
+            checked = 'X' in joined or '☑' in joined
+            for key, keyword in (('is_director', 'Director'),
+                                 ('is_officer', 'Officer'),
+                                 ('is_10pct_owner', '10% Owner')):
+                if keyword in joined:
+                    relationship_flags[key] = checked
+
+            for val in cells:
+                if _OFFICER_TITLE_RE.search(val):
+                    title = val.strip()
 
-def extract_reporting_person(file_path: str, sheet_name: str) -> Dict[str, str]:
-    
-    df = read_excel_with_merged_cells(file_path, sheet_name)
-    
     person_info = {}
-    
-    
-    for idx, row in df.iterrows():
-        row_str = ' '.join([str(val) for val in row if pd.notna(val)])
-        
-        
-        if 'Name and Address of Reporting Person' in row_str or idx == 0:
-            
-            for val in row:
-                if pd.notna(val) and isinstance(val, str) and len(str(val)) > 3:
-                    if 'Name and Address' not in str(val):
-                        person_info['name'] = str(val).strip()
-                        break
-        
-        
-        if 'Relationship of Reporting Person' in row_str or 'Director' in row_str or 'Officer' in row_str:
-            
-            if 'Director' in row_str:
-                person_info['is_director'] = 'X' in row_str or '☑' in row_str
-            if 'Officer' in row_str:
-                person_info['is_officer'] = 'X' in row_str or '☑' in row_str
-            if '10% Owner' in row_str:
-                person_info['is_10pct_owner'] = 'X' in row_str or '☑' in row_str
-            
-            
-            for val in row:
-                if pd.notna(val) and isinstance(val, str):
-                    if any(title in str(val) for title in ['President', 'CEO', 'CFO', 'Director', 'Officer']):
-                        person_info['title'] = str(val).strip()
-    
+    if name is not None:
+        person_info['name'] = name
+    person_info.update(relationship_flags)
+    if title is not None:
+        person_info['title'] = title
+
     return person_info
 
 
-def extract_nonderivative_transactions(file_path: str, sheet_name: str) -> pd.DataFrame:
+def _drop_empty_rows(df: pd.DataFrame) -> pd.DataFrame:
+
+
+    mask = pd.notna(df.to_numpy(dtype=object)).any(axis=1)
+    return df.iloc[mask].reset_index(drop=True)
+
+
+def extract_nonderivative_transactions(workbook, sheet_name: str) -> pd.DataFrame:
     
-    df = extract_table_from_sheet(file_path, sheet_name, header_rows=2)
+    df = extract_table_from_worksheet(workbook[sheet_name], header_rows=2)
     
     if df.empty:
         return pd.DataFrame()
@@ -62,53 +157,27 @@ def extract_nonderivative_transactions(file_path: str, sheet_name: str) -> pd.Da
     df = clean_whitespace(df)
     
     
-    column_mapping = {
-        'title of security': 'security_title',
-        '1. title of security': 'security_title',
-        'transaction date': 'transaction_date',
-        '2. transaction date': 'transaction_date',
-        'transaction code': 'transaction_code',
-        '3. transaction code': 'transaction_code',
-        'code': 'transaction_code',
-        'amount': 'amount',
-        'shares': 'shares',
-        'price': 'price',
-        'price per share': 'price_per_share',
-        'securities acquired': 'securities_acquired',
-        'securities disposed': 'securities_disposed',
-        'amount of securities beneficially owned': 'securities_owned_after',
-        '5. amount of securities beneficially owned': 'securities_owned_after',
-        'ownership form': 'ownership_form',
-        '6. ownership form': 'ownership_form'
-    }
-    
-    
-    for old_name, new_name in column_mapping.items():
-        for col in df.columns:
-            if old_name in str(col).lower():
-                df.rename(columns={col: new_name}, inplace=True)
-                break
-    
-    
-    numeric_cols = ['amount', 'shares', 'price', 'price_per_share', 
-                   'securities_acquired', 'securities_disposed', 'securities_owned_after']
-    for col in numeric_cols:
-        if col in df.columns:
-            df[col] = clean_numeric_column(df[col])
+    df = _rename_columns(df, _NONDERIVATIVE_PATTERN, _NONDERIVATIVE_TARGETS)
     
     
+    numeric_cols = ['amount', 'shares', 'price', 'price_per_share',
+                   'securities_acquired', 'securities_disposed', 'securities_owned_after']
+    present = [col for col in numeric_cols if col in df.columns]
+    if present:
+        df[present] = df[present].apply(clean_numeric_column)
+
+
     if 'transaction_date' in df.columns:
-        df['transaction_date'] = df['transaction_date'].apply(standardize_date)
+        converted = pd.to_datetime(df['transaction_date'], errors='coerce')
+        df['transaction_date'] = converted.dt.strftime('%Y-%m-%d')
     
     
-    df = df.dropna(how='all')
-    
-    return df
+    return _drop_empty_rows(df)
 
 
-def extract_derivative_transactions(file_path: str, sheet_name: str) -> pd.DataFrame:
+def extract_derivative_transactions(workbook, sheet_name: str) -> pd.DataFrame:
     
-    df = extract_table_from_sheet(file_path, sheet_name, header_rows=2)
+    df = extract_table_from_worksheet(workbook[sheet_name], header_rows=2)
     
     if df.empty:
         return pd.DataFrame()
@@ -117,130 +186,125 @@ def extract_derivative_transactions(file_path: str, sheet_name: str) -> pd.DataF
     df = clean_whitespace(df)
     
     
-    column_mapping = {
-        'title of derivative security': 'derivative_title',
-        '1. title of derivative security': 'derivative_title',
-        'conversion or exercise price': 'exercise_price',
-        '2. conversion or exercise price': 'exercise_price',
-        'transaction date': 'transaction_date',
-        '3. transaction date': 'transaction_date',
-        'transaction code': 'transaction_code',
-        '4. transaction code': 'transaction_code',
-        'number of derivative securities': 'number_of_securities',
-        'date exercisable': 'date_exercisable',
-        'expiration date': 'expiration_date',
-        'title and amount of securities underlying': 'underlying_securities',
-        'price of derivative security': 'derivative_price'
-    }
-    
-    for old_name, new_name in column_mapping.items():
-        for col in df.columns:
-            if old_name in str(col).lower():
-                df.rename(columns={col: new_name}, inplace=True)
-                break
+    df = _rename_columns(df, _DERIVATIVE_PATTERN, _DERIVATIVE_TARGETS)
     
     
     numeric_cols = ['exercise_price', 'number_of_securities', 'derivative_price']
-    for col in numeric_cols:
-        if col in df.columns:
-            df[col] = clean_numeric_column(df[col])
-    
-    
+    present = [col for col in numeric_cols if col in df.columns]
+    if present:
+        df[present] = df[present].apply(clean_numeric_column)
+
+
     date_cols = ['transaction_date', 'date_exercisable', 'expiration_date']
-    for col in date_cols:
-        if col in df.columns:
-            df[col] = df[col].apply(standardize_date)
-    
-    df = df.dropna(how='all')
+    present_dates = [col for col in date_cols if col in df.columns]
+    if present_dates:
+        converted = df[present_dates].apply(pd.to_datetime, errors='coerce')
+        df[present_dates] = converted.apply(lambda col: col.dt.strftime('%Y-%m-%d'))
     
-    return df
+    return _drop_empty_rows(df)
 
 
-def process_form4_file(file_path: str, output_dir: str) -> Dict[str, str]:
+def process_form4_file(file_path: str, output_dir: str) -> FilingResult:
     
-    print(f"Processing Form 4: {Path(file_path).name}")
+    log.info(f"Processing Form 4: {Path(file_path).name}")
     
     metadata = get_filing_metadata(file_path)
-    sheet_names = get_sheet_names(file_path)
-    
-    if len(sheet_names) < 2:
-        print(f"  Warning: Expected 3 sheets, found {len(sheet_names)}")
-        return {'status': 'error', 'message': 'Insufficient sheets'}
-    
-    results = {'status': 'success', 'metadata': metadata}
-    
-    
-    person_info = extract_reporting_person(file_path, sheet_names[0])
-    results['person_info'] = person_info
-    
-    
-    nonderivative_df = extract_nonderivative_transactions(file_path, sheet_names[1])
-    
-    
-    for key, value in metadata.items():
-        nonderivative_df[key] = value
-    for key, value in person_info.items():
-        nonderivative_df[f'person_{key}'] = value
-    
-    
-    if not nonderivative_df.empty:
-        filing_date = metadata.get('filing_date', 'unknown').replace('-', '')
-        person_name = person_info.get('name', 'unknown').replace(' ', '_').replace('.', '')
-        output_file = f"{output_dir}/form4_nonderivative_{filing_date}_{person_name}.csv"
-        nonderivative_df.to_csv(output_file, index=False)
-        results['nonderivative_file'] = output_file
-        print(f"  Saved non-derivative transactions: {output_file}")
-    
-    
-    if len(sheet_names) >= 3:
-        derivative_df = extract_derivative_transactions(file_path, sheet_names[2])
-        
-        
-        for key, value in metadata.items():
-            derivative_df[key] = value
-        for key, value in person_info.items():
-            derivative_df[f'person_{key}'] = value
-        
-        if not derivative_df.empty:
-            output_file = f"{output_dir}/form4_derivative_{filing_date}_{person_name}.csv"
-            derivative_df.to_csv(output_file, index=False)
-            results['derivative_file'] = output_file
-            print(f"  Saved derivative transactions: {output_file}")
-    
+
+    workbook = openpyxl.load_workbook(file_path, data_only=True)
+    try:
+        sheet_names = workbook.sheetnames
+
+        if len(sheet_names) < 2:
+            log.warning(f"  Warning: Expected 3 sheets, found {len(sheet_names)}")
+            return FilingResult(status='error', message='Insufficient sheets')
+
+        results = FilingResult(status='success', metadata=metadata)
+
+        filing_date = metadata.get('filing_date', 'unknown').translate(_DATE_TRANS)
+
+
+        person_info = extract_reporting_person(workbook, sheet_names[0])
+        results.person_info = person_info
+        person_name = person_info.get('name', 'unknown').translate(_NAME_TRANS)
+
+        constant_cols = {**metadata,
+                         **{f'person_{key}': value
+                            for key, value in person_info.items()}}
+
+
+        nonderivative_df = extract_nonderivative_transactions(workbook, sheet_names[1])
+
+
+        if not nonderivative_df.empty:
+            output_file = f"{output_dir}/form4_nonderivative_{filing_date}_{person_name}.csv"
+            write_csv_with_constants(nonderivative_df, constant_cols, output_file)
+            results.nonderivative_file = output_file
+            log.info(f"  Saved non-derivative transactions: {output_file}")
+
+
+        if len(sheet_names) >= 3:
+            derivative_df = extract_derivative_transactions(workbook, sheet_names[2])
+
+            if not derivative_df.empty:
+                output_file = f"{output_dir}/form4_derivative_{filing_date}_{person_name}.csv"
+                write_csv_with_constants(derivative_df, constant_cols, output_file)
+                results.derivative_file = output_file
+                log.info(f"  Saved derivative transactions: {output_file}")
+    finally:
+        workbook.close()
+
     return results
 
 
-def process_all_form4_files(input_dir: str, output_dir: str) -> List[Dict]:
+def _safe_process_form4(file_path: str, output_dir: str) -> FilingResult:
+
+    try:
+        return process_form4_file(file_path, output_dir)
+    except Exception as e:
+        log.error(f"  Error processing {Path(file_path).name}: {e}")
+        return FilingResult(status='error', file=file_path, error=str(e))
+
+
+def process_all_form4_files(input_dir: str, output_dir: str) -> List[FilingResult]:
     
     input_path = Path(input_dir)
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
     
     
-    form4_files = list(input_path.glob('**/*Statement of changes in beneficial ownership*.xlsx'))
+    form4_files = find_files(input_dir, '*Statement of changes in beneficial ownership*.xlsx')
     
-    print(f"\nProcessing {len(form4_files)} Form 4 files...")
-    print("=" * 80)
+    log.info(f"\nProcessing {len(form4_files)} Form 4 files...")
+    log.info("=" * 80)
     
-    results = []
-    for file_path in form4_files:
-        try:
-            result = process_form4_file(str(file_path), str(output_path))
-            results.append(result)
-        except Exception as e:
-            print(f"  Error processing {file_path.name}: {e}")
-            results.append({'status': 'error', 'file': str(file_path), 'error': str(e)})
     
+    advise_willneed(form4_files)
     
-    successful = sum(1 for r in results if r.get('status') == 'success')
-    print(f"\n{'=' * 80}")
-    print(f"Form 4 Processing Complete: {successful}/{len(form4_files)} successful")
+    if len(form4_files) > 1:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = list(executor.map(
+                partial(_safe_process_form4, output_dir=str(output_path)),
+                map(str, form4_files)))
+    else:
+        results = [_safe_process_form4(str(file_path), str(output_path))
+                   for file_path in form4_files]
+    
+    
+    if results:
+        manifest = pd.DataFrame([r.to_dict() for r in results])
+        write_csv(manifest, str(output_path / 'form4_manifest.csv'))
+
+    successful = sum(1 for r in results if r.status == 'success')
+    log.info(f"\n{'=' * 80}")
+    log.info(f"Form 4 Processing Complete: {successful}/{len(form4_files)} successful")
     
     return results
 
 
 if __name__ == '__main__':
-    
+    from utils.log_setup import setup_basic_logging
+    setup_basic_logging()
+
     base_dir = Path(__file__).parent.parent.parent.parent
     input_dir = base_dir / 'data' / 'raw' / 'insider transactions'
     output_dir = base_dir / 'data' / 'processed' / 'insider transactions'
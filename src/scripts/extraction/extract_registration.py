@@ -1,28 +1,68 @@
 
 
+import logging
+import openpyxl
+import os
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 import sys
 from typing import Dict, List, Optional
 
 sys.path.append(str(Path(__file__).parent.parent))
-from utils.excel_parser import (get_filing_metadata, extract_table_from_sheet,
-                                find_sheets_by_keyword, get_sheet_names)
+from utils.excel_parser import (get_filing_metadata, extract_table_from_worksheet,
+                                list_sheet_names_lower)
 from utils.data_cleaner import clean_financial_table
+from utils.io_utils import write_csv
+from utils.results import FilingResult
 
+log = logging.getLogger(__name__)
+from utils.file_index import find_files
 
-def extract_offering_information(file_path: str) -> Optional[pd.DataFrame]:
-    
-    sheet_keywords = ['offering', 'prospectus', 'shares']
-    matching_sheets = find_sheets_by_keyword(file_path, sheet_keywords)
+
+SHEET_CATEGORIES = [
+    ('offering', ['offering', 'prospectus', 'shares']),
+    ('preipo', ['pre-ipo', 'preipo', 'private placement']),
+    ('beneficial_ownership', ['beneficial ownership', 'ownership table']),
+    ('proceeds', ['proceeds', 'use of proceeds']),
+    ('warrants', ['placement agent warrants', 'placement agent']),
+    ('risk_factors', ['risk factors', 'risk']),
+    ('balance_sheet', ['balance sheet', 'balance']),
+    ('income_statement', ['income', 'operations', 'statement of operations']),
+]
+
+HEADER_ROWS = {'balance_sheet': 2, 'income_statement': 2}
+
+CATEGORY_EXCLUDES = {'income_statement': ('cash',)}
+
+_DATE_TRANS = str.maketrans({'-': ''})
+_FORM_TRANS = str.maketrans({' ': '_', '/': '_'})
+
+
+def classify_sheets(sheet_names_lower) -> Dict[str, List[str]]:
+
+
+    categories = {category: [] for category, _ in SHEET_CATEGORIES}
+
+    for sheet_name, sheet_lower in sheet_names_lower:
+        for category, keywords in SHEET_CATEGORIES:
+            if any(exclude in sheet_lower
+                   for exclude in CATEGORY_EXCLUDES.get(category, ())):
+                continue
+            if any(keyword in sheet_lower for keyword in keywords):
+                categories[category].append(sheet_name)
+
+    return categories
+
+
+def extract_offering_information(df: Optional[pd.DataFrame],
+                                 sheet_name: Optional[str]) -> Optional[pd.DataFrame]:
     
-    if not matching_sheets:
+    if sheet_name is None:
         return None
     
-    sheet_name = matching_sheets[0]
-    print(f"  Extracting offering info from: {sheet_name}")
-    
-    df = extract_table_from_sheet(file_path, sheet_name, header_rows=1)
+    log.info(f"  Extracting offering info from: {sheet_name}")
     
     if df.empty:
         return None
@@ -30,19 +70,14 @@ def extract_offering_information(file_path: str) -> Optional[pd.DataFrame]:
     return clean_financial_table(df)
 
 
-def extract_preipo_ownership(file_path: str) -> Optional[pd.DataFrame]:
+def extract_preipo_ownership(df: Optional[pd.DataFrame],
+                             sheet_name: Optional[str]) -> Optional[pd.DataFrame]:
     
-    sheet_keywords = ['pre-ipo', 'preipo', 'private placement']
-    matching_sheets = find_sheets_by_keyword(file_path, sheet_keywords)
-    
-    if not matching_sheets:
-        print("  No pre-IPO ownership table found")
+    if sheet_name is None:
+        log.info("  No pre-IPO ownership table found")
         return None
     
-    sheet_name = matching_sheets[0]
-    print(f"  Extracting pre-IPO ownership from: {sheet_name}")
-    
-    df = extract_table_from_sheet(file_path, sheet_name, header_rows=1)
+    log.info(f"  Extracting pre-IPO ownership from: {sheet_name}")
     
     if df.empty:
         return None
@@ -50,19 +85,14 @@ def extract_preipo_ownership(file_path: str) -> Optional[pd.DataFrame]:
     return clean_financial_table(df)
 
 
-def extract_beneficial_ownership_table(file_path: str) -> Optional[pd.DataFrame]:
+def extract_beneficial_ownership_table(df: Optional[pd.DataFrame],
+                                       sheet_name: Optional[str]) -> Optional[pd.DataFrame]:
     
-    sheet_keywords = ['beneficial ownership', 'ownership table']
-    matching_sheets = find_sheets_by_keyword(file_path, sheet_keywords)
-    
-    if not matching_sheets:
-        print("  No beneficial ownership table found")
+    if sheet_name is None:
+        log.info("  No beneficial ownership table found")
         return None
     
-    sheet_name = matching_sheets[0]
-    print(f"  Extracting beneficial ownership from: {sheet_name}")
-    
-    df = extract_table_from_sheet(file_path, sheet_name, header_rows=1)
+    log.info(f"  Extracting beneficial ownership from: {sheet_name}")
     
     if df.empty:
         return None
@@ -70,18 +100,13 @@ def extract_beneficial_ownership_table(file_path: str) -> Optional[pd.DataFrame]
     return clean_financial_table(df)
 
 
-def extract_use_of_proceeds(file_path: str) -> Optional[pd.DataFrame]:
+def extract_use_of_proceeds(df: Optional[pd.DataFrame],
+                            sheet_name: Optional[str]) -> Optional[pd.DataFrame]:
     
-    sheet_keywords = ['proceeds', 'use of proceeds']
-    matching_sheets = find_sheets_by_keyword(file_path, sheet_keywords)
-    
-    if not matching_sheets:
+    if sheet_name is None:
         return None
     
-    sheet_name = matching_sheets[0]
-    print(f"  Extracting use of proceeds from: {sheet_name}")
-    
-    df = extract_table_from_sheet(file_path, sheet_name, header_rows=1)
+    log.info(f"  Extracting use of proceeds from: {sheet_name}")
     
     if df.empty:
         return None
@@ -89,18 +114,13 @@ def extract_use_of_proceeds(file_path: str) -> Optional[pd.DataFrame]:
     return clean_financial_table(df)
 
 
-def extract_placement_agent_warrants(file_path: str) -> Optional[pd.DataFrame]:
-    
-    sheet_keywords = ['placement agent warrants', 'placement agent']
-    matching_sheets = find_sheets_by_keyword(file_path, sheet_keywords)
+def extract_placement_agent_warrants(df: Optional[pd.DataFrame],
+                                     sheet_name: Optional[str]) -> Optional[pd.DataFrame]:
     
-    if not matching_sheets:
+    if sheet_name is None:
         return None
     
-    sheet_name = matching_sheets[0]
-    print(f"  Extracting placement agent warrants from: {sheet_name}")
-    
-    df = extract_table_from_sheet(file_path, sheet_name, header_rows=1)
+    log.info(f"  Extracting placement agent warrants from: {sheet_name}")
     
     if df.empty:
         return None
@@ -108,18 +128,13 @@ def extract_placement_agent_warrants(file_path: str) -> Optional[pd.DataFrame]:
     return clean_financial_table(df)
 
 
-def extract_risk_factors_summary(file_path: str) -> Optional[pd.DataFrame]:
-    
-    sheet_keywords = ['risk factors', 'risk']
-    matching_sheets = find_sheets_by_keyword(file_path, sheet_keywords)
+def extract_risk_factors_summary(df: Optional[pd.DataFrame],
+                                 sheet_name: Optional[str]) -> Optional[pd.DataFrame]:
     
-    if not matching_sheets:
+    if sheet_name is None:
         return None
     
-    sheet_name = matching_sheets[0]
-    print(f"  Extracting risk factors from: {sheet_name}")
-    
-    df = extract_table_from_sheet(file_path, sheet_name, header_rows=1)
+    log.info(f"  Extracting risk factors from: {sheet_name}")
     
     if df.empty or len(df.columns) < 2:
         return None
@@ -127,124 +142,167 @@ def extract_risk_factors_summary(file_path: str) -> Optional[pd.DataFrame]:
     return clean_financial_table(df)
 
 
-def extract_financial_statements(file_path: str) -> Dict[str, pd.DataFrame]:
+def extract_financial_statements(balance_df: Optional[pd.DataFrame],
+                                 income_df: Optional[pd.DataFrame]) -> Dict[str, pd.DataFrame]:
     
     results = {}
     
     
-    balance_keywords = ['balance sheet', 'balance']
-    balance_sheets = find_sheets_by_keyword(file_path, balance_keywords)
-    if balance_sheets:
-        df = extract_table_from_sheet(file_path, balance_sheets[0], header_rows=2)
-        if not df.empty:
-            results['balance_sheet'] = clean_financial_table(df, in_thousands=True)
-            print(f"  ✓ Found balance sheet")
+    if balance_df is not None and not balance_df.empty:
+        results['balance_sheet'] = clean_financial_table(balance_df, in_thousands=True)
+        log.info(f"  ✓ Found balance sheet")
     
     
-    income_keywords = ['income', 'operations', 'statement of operations']
-    income_sheets = find_sheets_by_keyword(file_path, income_keywords)
-    if income_sheets:
-        for sheet in income_sheets:
-            if 'cash' not in sheet.lower():
-                df = extract_table_from_sheet(file_path, sheet, header_rows=2)
-                if not df.empty:
-                    results['income_statement'] = clean_financial_table(df, in_thousands=True)
-                    print(f"  ✓ Found income statement")
-                break
+    if income_df is not None and not income_df.empty:
+        results['income_statement'] = clean_financial_table(income_df, in_thousands=True)
+        log.info(f"  ✓ Found income statement")
     
     return results
 
 
-def process_registration_file(file_path: str, output_dir: str) -> Dict[str, str]:
+def _resolve(tables, category: str) -> Optional[pd.DataFrame]:
+
+    future = tables.get(category)
+    return future.result() if future is not None else None
+
+
+def process_registration_file(file_path: str, output_dir: str) -> FilingResult:
     
-    print(f"\nProcessing Registration: {Path(file_path).name}")
+    log.info(f"\nProcessing Registration: {Path(file_path).name}")
     
     metadata = get_filing_metadata(file_path)
-    filing_date = metadata.get('filing_date', 'unknown').replace('-', '')
-    form_code = metadata.get('form_code', 'reg').replace(' ', '_').replace('/', '_')
-    
-    results = {'status': 'success', 'metadata': metadata, 'files_created': []}
-    
-    
-    offering_df = extract_offering_information(file_path)
-    if offering_df is not None and not offering_df.empty:
-        output_file = f"{output_dir}/{form_code}_offering_info_{filing_date}.csv"
-        offering_df.to_csv(output_file, index=False)
-        results['files_created'].append(output_file)
-        print(f"  ✓ Saved offering information")
-    
-    
-    preipo_df = extract_preipo_ownership(file_path)
-    if preipo_df is not None and not preipo_df.empty:
-        output_file = f"{output_dir}/{form_code}_preipo_ownership_{filing_date}.csv"
-        preipo_df.to_csv(output_file, index=False)
-        results['files_created'].append(output_file)
-        print(f"  ✓ Saved pre-IPO ownership")
-    
-    
-    ownership_df = extract_beneficial_ownership_table(file_path)
-    if ownership_df is not None and not ownership_df.empty:
-        output_file = f"{output_dir}/{form_code}_beneficial_ownership_{filing_date}.csv"
-        ownership_df.to_csv(output_file, index=False)
-        results['files_created'].append(output_file)
-        print(f"  ✓ Saved beneficial ownership")
-    
-    
-    proceeds_df = extract_use_of_proceeds(file_path)
-    if proceeds_df is not None and not proceeds_df.empty:
-        output_file = f"{output_dir}/{form_code}_use_of_proceeds_{filing_date}.csv"
-        proceeds_df.to_csv(output_file, index=False)
-        results['files_created'].append(output_file)
-        print(f"  ✓ Saved use of proceeds")
-    
-    
-    warrants_df = extract_placement_agent_warrants(file_path)
-    if warrants_df is not None and not warrants_df.empty:
-        output_file = f"{output_dir}/{form_code}_placement_warrants_{filing_date}.csv"
-        warrants_df.to_csv(output_file, index=False)
-        results['files_created'].append(output_file)
-        print(f"  ✓ Saved placement agent warrants")
-    
-    
-    financial_statements = extract_financial_statements(file_path)
-    for stmt_type, df in financial_statements.items():
-        output_file = f"{output_dir}/{form_code}_{stmt_type}_{filing_date}.csv"
-        df.to_csv(output_file, index=False)
-        results['files_created'].append(output_file)
-        print(f"  ✓ Saved {stmt_type}")
+    filing_date = metadata.get('filing_date', 'unknown').translate(_DATE_TRANS)
+    form_code = metadata.get('form_code', 'reg').translate(_FORM_TRANS)
     
+    results = FilingResult(status='success', metadata=metadata)
+
+
+    workbook = openpyxl.load_workbook(file_path, data_only=True)
+    candidates = classify_sheets(list_sheet_names_lower(workbook))
+    categories = {category: names[0] if names else None
+                  for category, names in candidates.items()}
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        tables = {category: pool.submit(extract_table_from_worksheet,
+                                        workbook[sheet_name],
+                                        header_rows=HEADER_ROWS.get(category, 1))
+                  for category, sheet_name in categories.items()
+                  if sheet_name is not None}
+
+        try:
+            offering_df = extract_offering_information(_resolve(tables, 'offering'),
+                                                       categories['offering'])
+            if offering_df is not None and not offering_df.empty:
+                output_file = f"{output_dir}/{form_code}_offering_info_{filing_date}.csv"
+                write_csv(offering_df, output_file)
+                results.files_created.append(output_file)
+                log.info(f"  ✓ Saved offering information")
+    
+    
+            preipo_df = extract_preipo_ownership(_resolve(tables, 'preipo'),
+                                                 categories['preipo'])
+            if preipo_df is not None and not preipo_df.empty:
+                output_file = f"{output_dir}/{form_code}_preipo_ownership_{filing_date}.csv"
+                write_csv(preipo_df, output_file)
+                results.files_created.append(output_file)
+                log.info(f"  ✓ Saved pre-IPO ownership")
+    
+    
+            ownership_df = extract_beneficial_ownership_table(
+                _resolve(tables, 'beneficial_ownership'), categories['beneficial_ownership'])
+            if ownership_df is not None and not ownership_df.empty:
+                output_file = f"{output_dir}/{form_code}_beneficial_ownership_{filing_date}.csv"
+                write_csv(ownership_df, output_file)
+                results.files_created.append(output_file)
+                log.info(f"  ✓ Saved beneficial ownership")
+    
+    
+            proceeds_df = extract_use_of_proceeds(_resolve(tables, 'proceeds'),
+                                                  categories['proceeds'])
+            if proceeds_df is not None and not proceeds_df.empty:
+                output_file = f"{output_dir}/{form_code}_use_of_proceeds_{filing_date}.csv"
+                write_csv(proceeds_df, output_file)
+                results.files_created.append(output_file)
+                log.info(f"  ✓ Saved use of proceeds")
+    
+    
+            warrants_df = extract_placement_agent_warrants(_resolve(tables, 'warrants'),
+                                                           categories['warrants'])
+            if warrants_df is not None and not warrants_df.empty:
+                output_file = f"{output_dir}/{form_code}_placement_warrants_{filing_date}.csv"
+                write_csv(warrants_df, output_file)
+                results.files_created.append(output_file)
+                log.info(f"  ✓ Saved placement agent warrants")
+    
+    
+            income_df = _resolve(tables, 'income_statement')
+            for sheet_name in candidates['income_statement'][1:]:
+                if income_df is not None and not income_df.empty:
+                    break
+                log.info(f"  Income sheet empty, trying fallback: {sheet_name}")
+                income_df = extract_table_from_worksheet(
+                    workbook[sheet_name],
+                    header_rows=HEADER_ROWS.get('income_statement', 1))
+
+            financial_statements = extract_financial_statements(
+                _resolve(tables, 'balance_sheet'), income_df)
+            for stmt_type, df in financial_statements.items():
+                output_file = f"{output_dir}/{form_code}_{stmt_type}_{filing_date}.csv"
+                write_csv(df, output_file)
+                results.files_created.append(output_file)
+                log.info(f"  ✓ Saved {stmt_type}")
+    
+        finally:
+            workbook.close()
+
     return results
 
 
-def process_all_registration_files(input_dir: str, output_dir: str) -> List[Dict]:
+def _safe_process_registration(file_path: str, output_dir: str) -> FilingResult:
+
+    try:
+        return process_registration_file(file_path, output_dir)
+    except Exception as e:
+        log.error(f"  Error processing {Path(file_path).name}: {e}")
+        return FilingResult(status='error', file=file_path, error=str(e))
+
+
+def process_all_registration_files(input_dir: str, output_dir: str) -> List[FilingResult]:
     
     input_path = Path(input_dir)
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
     
     
-    files_reg = list(input_path.glob('**/*.xlsx'))
+    files_reg = find_files(input_dir, '*.xlsx')
     
-    print(f"\nProcessing {len(files_reg)} Registration Statement files...")
-    print("=" * 80)
+    log.info(f"\nProcessing {len(files_reg)} Registration Statement files...")
+    log.info("=" * 80)
     
-    results = []
-    for file_path in files_reg:
-        try:
-            result = process_registration_file(str(file_path), str(output_path))
-            results.append(result)
-        except Exception as e:
-            print(f"  Error processing {file_path.name}: {e}")
-            results.append({'status': 'error', 'file': str(file_path), 'error': str(e)})
+    if len(files_reg) > 1:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = list(executor.map(
+                partial(_safe_process_registration, output_dir=str(output_path)),
+                map(str, files_reg)))
+    else:
+        results = [_safe_process_registration(str(file_path), str(output_path))
+                   for file_path in files_reg]
     
-    successful = sum(1 for r in results if r.get('status') == 'success')
-    print(f"\n{'=' * 80}")
-    print(f"Registration Processing Complete: {successful}/{len(files_reg)} successful")
+    if results:
+        manifest = pd.DataFrame([r.to_dict() for r in results])
+        write_csv(manifest, str(output_path / 'registration_manifest.csv'))
+
+    successful = sum(1 for r in results if r.status == 'success')
+    log.info(f"\n{'=' * 80}")
+    log.info(f"Registration Processing Complete: {successful}/{len(files_reg)} successful")
     
     return results
 
 
 if __name__ == '__main__':
+    from utils.log_setup import setup_basic_logging
+    setup_basic_logging()
+
     base_dir = Path(__file__).parent.parent.parent.parent
     input_dir = base_dir / 'data' / 'raw' / 'registration statements'
     output_dir = base_dir / 'data' / 'processed' / 'registration statements'
@@ -18,7 +18,10 @@ Usage:
 """
 
 import argparse
+import logging
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
 import json
@@ -32,6 +35,11 @@ from extraction.extract_10k import process_all_10k_files
 from extraction.extract_8k import process_all_8k_files
 from extraction.extract_def14a import process_all_def14a_files
 from extraction.extract_registration import process_all_registration_files
+from utils.log_setup import setup_queue_logging
+from utils.parse_cache import directory_signature, load_entry, save_entry
+from utils.results import FilingResult
+
+log = logging.getLogger(__name__)
 
 
 
@@ -88,19 +96,19 @@ EXTRACTORS = {
 
 def print_banner():
     
-    print("\n" + "=" * 80)
-    print("RICHTECH ROBOTICS - SEC FILINGS DATA EXTRACTION")
-    print("=" * 80)
-    print(f"Start time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"Base directory: {BASE_DIR}")
-    print("=" * 80 + "\n")
+    log.info("\n" + "=" * 80)
+    log.info("RICHTECH ROBOTICS - SEC FILINGS DATA EXTRACTION")
+    log.info("=" * 80)
+    log.info(f"Start time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    log.info(f"Base directory: {BASE_DIR}")
+    log.info("=" * 80 + "\n")
 
 
 def print_summary(results: dict):
     
-    print("\n" + "=" * 80)
-    print("EXTRACTION SUMMARY")
-    print("=" * 80)
+    log.info("\n" + "=" * 80)
+    log.info("EXTRACTION SUMMARY")
+    log.info("=" * 80)
     
     total_processed = 0
     total_successful = 0
@@ -108,7 +116,7 @@ def print_summary(results: dict):
     
     for extractor_name, result in results.items():
         if result['status'] == 'skipped':
-            print(f"\n{result['name']}: SKIPPED")
+            log.info(f"\n{result['name']}: SKIPPED")
             continue
         
         processed = result.get('processed', 0)
@@ -120,35 +128,54 @@ def print_summary(results: dict):
         total_failed += failed
         
         status_symbol = "✓" if failed == 0 else "⚠"
-        print(f"\n{status_symbol} {result['name']}:")
-        print(f"  Processed: {processed}")
-        print(f"  Successful: {successful}")
-        print(f"  Failed: {failed}")
+        log.info(f"\n{status_symbol} {result['name']}:")
+        log.info(f"  Processed: {processed}")
+        log.info(f"  Successful: {successful}")
+        log.info(f"  Failed: {failed}")
         
         if result.get('files_created'):
-            print(f"  Files created: {result['files_created']}")
+            log.info(f"  Files created: {result['files_created']}")
     
-    print(f"\n{'=' * 80}")
-    print(f"TOTALS:")
-    print(f"  Total files processed: {total_processed}")
-    print(f"  Total successful: {total_successful}")
-    print(f"  Total failed: {total_failed}")
-    print(f"\nEnd time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("=" * 80 + "\n")
+    log.info(f"\n{'=' * 80}")
+    log.info(f"TOTALS:")
+    log.info(f"  Total files processed: {total_processed}")
+    log.info(f"  Total successful: {total_successful}")
+    log.info(f"  Total failed: {total_failed}")
+    log.info(f"\nEnd time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    log.info("=" * 80 + "\n")
 
 
-def run_extractor(extractor_key: str, extractor_config: dict, verbose: bool = False) -> dict:
+def run_extractor(extractor_key: str, extractor_config: dict, verbose: bool = False,
+                  use_cache: bool = False) -> dict:
     
     name = extractor_config['name']
     function = extractor_config['function']
     input_dir = str(extractor_config['input_dir'])
     output_dir = str(extractor_config['output_dir'])
     
-    print(f"\n{'=' * 80}")
-    print(f"Starting: {name}")
-    print(f"Input: {input_dir}")
-    print(f"Output: {output_dir}")
-    print(f"{'=' * 80}")
+    log.info(f"\n{'=' * 80}")
+    log.info(f"Starting: {name}")
+    log.info(f"Input: {input_dir}")
+    log.info(f"Output: {output_dir}")
+    log.info(f"{'=' * 80}")
+    
+    
+    signature = directory_signature(input_dir) if use_cache else None
+    if use_cache:
+        entry = load_entry(PROCESSED_DATA_DIR, extractor_key)
+        if entry is not None and entry.get('signature') == signature and \
+           all(Path(p).exists() for p in entry.get('files', [])):
+            log.info(f"Inputs unchanged since last run, keeping cached outputs for {name}")
+            return {
+                'name': name,
+                'status': 'completed',
+                'cached': True,
+                'processed': entry.get('processed', 0),
+                'successful': entry.get('successful', 0),
+                'failed': entry.get('failed', 0),
+                'files_created': len(entry.get('files', [])),
+                'details': []
+            }
     
     try:
         
@@ -160,13 +187,24 @@ def run_extractor(extractor_key: str, extractor_config: dict, verbose: bool = Fa
         processed = len(extraction_results)
         
         
-        files_created = 0
+        output_files = []
         for r in extraction_results:
-            if r.get('files_created'):
-                files_created += len(r['files_created'])
-            elif r.get('nonderivative_file') or r.get('derivative_file'):
-                files_created += sum(1 for key in ['nonderivative_file', 'derivative_file'] 
-                                   if r.get(key))
+            files_created = r.get('files_created')
+            if files_created:
+                output_files.extend(files_created)
+            for key in ['nonderivative_file', 'derivative_file']:
+                value = r.get(key)
+                if value:
+                    output_files.append(value)
+        
+        if use_cache and failed == 0:
+            save_entry(PROCESSED_DATA_DIR, extractor_key, {
+                'signature': signature,
+                'processed': processed,
+                'successful': successful,
+                'failed': failed,
+                'files': output_files
+            })
         
         return {
             'name': name,
@@ -174,13 +212,13 @@ def run_extractor(extractor_key: str, extractor_config: dict, verbose: bool = Fa
             'processed': processed,
             'successful': successful,
             'failed': failed,
-            'files_created': files_created,
+            'files_created': len(output_files),
             'details': extraction_results
         }
         
     except Exception as e:
-        print(f"\n✗ ERROR: Failed to run {name}")
-        print(f"  Error: {str(e)}")
+        log.error(f"\n✗ ERROR: Failed to run {name}")
+        log.error(f"  Error: {str(e)}")
         return {
             'name': name,
             'status': 'error',
@@ -191,6 +229,13 @@ def run_extractor(extractor_key: str, extractor_config: dict, verbose: bool = Fa
         }
 
 
+def _json_default(obj):
+
+    if isinstance(obj, FilingResult):
+        return obj.to_dict()
+    return str(obj)
+
+
 def main():
     
     parser = argparse.ArgumentParser(
@@ -216,10 +261,17 @@ def main():
         action='store_true',
         help='Save extraction report to JSON file'
     )
+    parser.add_argument(
+        '--use-cache',
+        action='store_true',
+        help='Skip extractors whose inputs are unchanged since the last run'
+    )
     
     args = parser.parse_args()
-    
-    
+
+
+    listener = setup_queue_logging(logging.DEBUG if args.verbose else logging.INFO)
+
     print_banner()
     
     
@@ -229,25 +281,34 @@ def main():
         
         if args.only in EXTRACTORS:
             extractors_to_run[args.only] = EXTRACTORS[args.only]
-            print(f"Running only: {EXTRACTORS[args.only]['name']}\n")
+            log.info(f"Running only: {EXTRACTORS[args.only]['name']}\n")
         else:
-            print(f"ERROR: Unknown extractor '{args.only}'")
-            print(f"Available: {', '.join(EXTRACTORS.keys())}")
+            log.error(f"ERROR: Unknown extractor '{args.only}'")
+            log.info(f"Available: {', '.join(EXTRACTORS.keys())}")
             sys.exit(1)
     else:
         
         for key, config in EXTRACTORS.items():
             if args.skip and key == args.skip:
-                print(f"Skipping: {config['name']}\n")
+                log.info(f"Skipping: {config['name']}\n")
                 continue
             extractors_to_run[key] = config
     
     
     results = {}
     
-    for key, config in extractors_to_run.items():
-        result = run_extractor(key, config, args.verbose)
-        results[key] = result
+    if len(extractors_to_run) > 1:
+        with ProcessPoolExecutor(max_workers=min(len(extractors_to_run),
+                                                 os.cpu_count())) as executor:
+            futures = {executor.submit(run_extractor, key, config, args.verbose,
+                                       args.use_cache): key
+                       for key, config in extractors_to_run.items()}
+            completed = {futures[future]: future.result()
+                         for future in as_completed(futures)}
+        results = {key: completed[key] for key in extractors_to_run}
+    else:
+        for key, config in extractors_to_run.items():
+            results[key] = run_extractor(key, config, args.verbose, args.use_cache)
     
     
     print_summary(results)
@@ -255,11 +316,19 @@ def main():
     
     if args.save_report:
         report_file = PROCESSED_DATA_DIR / f"extraction_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(report_file, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
-        print(f"Report saved to: {report_file}\n")
+        with open(report_file, 'w', encoding='utf-8') as f:
+            f.write('{\n')
+            for i, (key, result) in enumerate(results.items()):
+                if i:
+                    f.write(',\n')
+                f.write(f'{json.dumps(key)}: ')
+                f.write(json.dumps(result, indent=2, default=_json_default))
+            f.write('\n}\n')
+        log.info(f"Report saved to: {report_file}\n")
     
     
+    listener.stop()
+
     total_failed = sum(r.get('failed', 0) for r in results.values())
     sys.exit(0 if total_failed == 0 else 1)
 
@@ -0,0 +1,16 @@
+
+
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from utils.file_index import build_index, save_index
+
+
+if __name__ == '__main__':
+    base_dir = Path(__file__).parent.parent.parent.parent
+    raw_dir = base_dir / 'data' / 'raw'
+
+    index = build_index(raw_dir)
+    save_index(raw_dir, index)
+    print(f"Indexed {len(index['files'])} .xlsx files under {raw_dir}")
@@ -0,0 +1,110 @@
+
+
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.append(str(Path(__file__).parent.parent))
+from utils.excel_parser import get_sheet_names
+from extraction import extract_10q, extract_def14a
+
+
+FORM_DIRS = {
+    '10q': 'quarterly reports',
+    '8k': '8-k related',
+    'def14a': 'proxies and info statements',
+}
+
+FORM_CONCEPTS = {
+    '10q': {
+        'balance_sheet': (extract_10q.BALANCE_PRIORITY_KEYWORDS +
+                          extract_10q.BALANCE_FALLBACK_KEYWORDS),
+        'income_statement': extract_10q.INCOME_KEYWORDS,
+        'cash_flow': extract_10q.CASH_FLOW_KEYWORDS,
+        'stockholders_equity': extract_10q.EQUITY_KEYWORDS,
+        'revenue_breakdown': extract_10q.REVENUE_KEYWORDS,
+        'earnings_per_share': extract_10q.EPS_KEYWORDS,
+    },
+    '8k': {
+        'payment_schedule': ['installment', 'payment', 'schedule', 'principal'],
+        'signatures': ['signature', 'signatures'],
+        'exhibits': ['exhibit'],
+    },
+    'def14a': {
+        'executive_compensation': extract_def14a.EXEC_COMP_KEYWORDS,
+        'director_compensation': extract_def14a.DIRECTOR_COMP_KEYWORDS,
+        'beneficial_ownership': extract_def14a.OWNERSHIP_KEYWORDS,
+        'audit_fees': extract_def14a.AUDIT_FEES_KEYWORDS,
+        'stock_options': extract_def14a.STOCK_OPTION_KEYWORDS,
+    },
+}
+
+OUTPUT_MODULE = Path(__file__).parent.parent / 'extraction' / '_specialized_sheets.py'
+
+
+def collect_sheet_names(raw_dir: Path, form_dir: str) -> List[str]:
+
+    seen = {}
+    for file_path in sorted((raw_dir / form_dir).glob('**/*.xlsx')):
+        for sheet_name in get_sheet_names(str(file_path)):
+            seen.setdefault(sheet_name, None)
+
+    return list(seen)
+
+
+def build_sheet_map(raw_dir: Path) -> Dict[str, Dict[str, List[str]]]:
+
+    sheet_map = {}
+    for form_type, form_dir in FORM_DIRS.items():
+        sheet_names = collect_sheet_names(raw_dir, form_dir)
+        concepts = {}
+
+        for concept, keywords in FORM_CONCEPTS[form_type].items():
+            lowered_keywords = [k.lower() for k in keywords]
+            matches = [name for name in sheet_names
+                       if any(k in name.lower() for k in lowered_keywords)]
+            concepts[concept] = matches
+
+        sheet_map[form_type] = concepts
+
+    return sheet_map
+
+
+def write_module(sheet_map: Dict[str, Dict[str, List[str]]]) -> None:
+
+    lines = [
+        '',
+        '',
+        '# Generated by tools/generate_sheet_map.py - do not edit by hand.',
+        '# Regenerate after new filings are added under data/raw/.',
+        '',
+        'SHEET_MAP = {',
+    ]
+
+    for form_type, concepts in sheet_map.items():
+        lines.append(f"    '{form_type}': {{")
+        for concept, names in concepts.items():
+            if names:
+                body = ', '.join(repr(name) for name in names)
+                lines.append(f"        '{concept}': {{{body}}},")
+            else:
+                lines.append(f"        '{concept}': set(),")
+        lines.append('    },')
+
+    lines.append('}')
+    lines.append('')
+
+    OUTPUT_MODULE.write_text('\n'.join(lines))
+    print(f"Wrote {OUTPUT_MODULE}")
+
+
+if __name__ == '__main__':
+    base_dir = Path(__file__).parent.parent.parent.parent
+    raw_dir = base_dir / 'data' / 'raw'
+
+    sheet_map = build_sheet_map(raw_dir)
+    for form_type, concepts in sheet_map.items():
+        matched = sum(len(names) for names in concepts.values())
+        print(f"{form_type}: {matched} sheet names mapped")
+
+    write_module(sheet_map)
@@ -2,6 +2,11 @@
 
 from .excel_parser import *
 from .data_cleaner import *
+from .io_utils import *
+from .batch import *
+from .file_index import *
+from .results import *
 
-__all__ = ['excel_parser', 'data_cleaner']
+__all__ = ['excel_parser', 'data_cleaner', 'io_utils', 'batch', 'file_index',
+           'results']
 
@@ -0,0 +1,22 @@
+
+
+import os
+from typing import Callable, List, Optional
+
+try:
+    import dask.bag
+    HAS_DASK = True
+except ImportError:
+    HAS_DASK = False
+
+
+def dask_map(process_one: Callable, paths, *args) -> Optional[List]:
+
+
+    paths = list(paths)
+
+    if not HAS_DASK or os.environ.get('NO_DASK') or len(paths) < 2:
+        return None
+
+    bag = dask.bag.from_sequence(paths, npartitions=len(paths))
+    return bag.map(process_one, *args).compute(scheduler='processes')
@@ -4,8 +4,45 @@ import pandas as pd
 import numpy as np
 import re
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Union, Optional
 
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+try:
+    import pyarrow
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+_STRING_DTYPE = 'string[pyarrow]' if HAS_PYARROW else 'string'
+
+
+_CURRENCY_RE = re.compile(r'[$€£¥,\s]')
+_NON_WORD_RE = re.compile(r'[^\w\s_-]')
+_MULTI_UNDERSCORE_RE = re.compile(r'_+')
+
+_MISSING = frozenset({'', '-', '—', 'n/a', 'na', 'none', 'nil', 'not applicable'})
+
+_STRIPPABLE_TYPES = frozenset({'string', 'empty', 'mixed', 'mixed-integer'})
+
+_HAS_DIGIT = re.compile(r'\d')
+
+_DATE_PATTERNS = [
+    (re.compile(r'^\d{4}-\d{2}-\d{2}$'), '%Y-%m-%d'),
+    (re.compile(r'^\d{1,2}/\d{1,2}/\d{4}$'), '%m/%d/%Y'),
+    (re.compile(r'^\d{1,2}/\d{1,2}/\d{4}$'), '%d/%m/%Y'),
+    (re.compile(r'^[A-Za-z]+ \d{1,2}, \d{4}$'), '%B %d, %Y'),
+    (re.compile(r'^[A-Za-z]+ \d{1,2}, \d{4}$'), '%b %d, %Y'),
+    (re.compile(r'^\d{4}/\d{2}/\d{2}$'), '%Y/%m/%d'),
+    (re.compile(r'^\d{1,2}-\d{1,2}-\d{4}$'), '%d-%m-%Y'),
+    (re.compile(r'^\d{8}$'), None),
+]
+
 
 def clean_numeric_value(value: Any, handle_negatives: bool = True) -> Optional[float]:
     
@@ -20,17 +57,32 @@ def clean_numeric_value(value: Any, handle_negatives: bool = True) -> Optional[f
     value_str = str(value).strip()
     
     
-    if value_str.lower() in ['', '-', '—', 'n/a', 'na', 'none', 'nil', 'not applicable']:
+    if value_str.lower() in _MISSING:
         return None
     
     
+    if HAS_NUMBA:
+        token, is_negative, is_percentage = _prepare_numeric_token(value_str,
+                                                                   handle_negatives)
+        buf = np.frombuffer(token.encode('utf-8'), dtype=np.uint8)
+        offsets = np.array([0, buf.size], dtype=np.int64)
+        parsed = _parse_float_buffer(buf, offsets)[0]
+        if np.isnan(parsed):
+            return None
+        if is_percentage:
+            parsed = parsed / 100
+        if is_negative:
+            parsed = -parsed
+        return float(parsed)
+    
+    
     is_negative = False
     if handle_negatives and value_str.startswith('(') and value_str.endswith(')'):
         is_negative = True
         value_str = value_str[1:-1]
     
     
-    value_str = re.sub(r'[$€£¥,\s]', '', value_str)
+    value_str = _CURRENCY_RE.sub('', value_str)
     
     
     is_percentage = value_str.endswith('%')
@@ -51,41 +103,177 @@ def clean_numeric_value(value: Any, handle_negatives: bool = True) -> Optional[f
         return None
 
 
+def _prepare_numeric_token(value_str: str, handle_negatives: bool):
+
+
+    is_negative = False
+    if handle_negatives and value_str.startswith('(') and value_str.endswith(')'):
+        is_negative = True
+        value_str = value_str[1:-1]
+
+    value_str = _CURRENCY_RE.sub('', value_str)
+
+    is_percentage = value_str.endswith('%')
+    if is_percentage:
+        value_str = value_str[:-1]
+
+    return value_str, is_negative, is_percentage
+
+
+if HAS_NUMBA:
+    @njit(cache=True)
+    def _parse_float_buffer(buf, offsets):
+
+        out = np.empty(offsets.size - 1, dtype=np.float64)
+        for i in range(offsets.size - 1):
+            j = offsets[i]
+            end = offsets[i + 1]
+
+            negative = False
+            if j < end and (buf[j] == 43 or buf[j] == 45):
+                negative = buf[j] == 45
+                j += 1
+
+            mantissa = 0.0
+            frac_scale = 0
+            digits = 0
+            while j < end and 48 <= buf[j] <= 57:
+                mantissa = mantissa * 10.0 + (buf[j] - 48)
+                digits += 1
+                j += 1
+            if j < end and buf[j] == 46:
+                j += 1
+                while j < end and 48 <= buf[j] <= 57:
+                    mantissa = mantissa * 10.0 + (buf[j] - 48)
+                    frac_scale += 1
+                    digits += 1
+                    j += 1
+            if digits == 0:
+                out[i] = np.nan
+                continue
+
+            exponent = 0
+            valid = True
+            if j < end and (buf[j] == 101 or buf[j] == 69):
+                j += 1
+                exp_negative = False
+                if j < end and (buf[j] == 43 or buf[j] == 45):
+                    exp_negative = buf[j] == 45
+                    j += 1
+                exp_digits = 0
+                exp_value = 0
+                while j < end and 48 <= buf[j] <= 57:
+                    exp_value = exp_value * 10 + (buf[j] - 48)
+                    exp_digits += 1
+                    j += 1
+                if exp_digits == 0:
+                    valid = False
+                exponent = -exp_value if exp_negative else exp_value
+
+            if not valid or j != end:
+                out[i] = np.nan
+                continue
+
+            value = mantissa * 10.0 ** (exponent - frac_scale)
+            out[i] = -value if negative else value
+        return out
+
+
+def _clean_numeric_column_compiled(series: pd.Series,
+                                   handle_negatives: bool = True) -> pd.Series:
+
+    values = series.to_numpy(dtype=object)
+    out = np.full(len(values), np.nan)
+
+
+    string_positions = []
+    encoded = []
+    negatives = []
+    percentages = []
+    for i, value in enumerate(values):
+        if isinstance(value, (int, float)):
+            out[i] = float(value)
+        elif isinstance(value, str):
+            token, is_negative, is_percentage = \
+                _prepare_numeric_token(value.strip(), handle_negatives)
+            string_positions.append(i)
+            encoded.append(token.encode('utf-8'))
+            negatives.append(is_negative)
+            percentages.append(is_percentage)
+
+    if encoded:
+        buf = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(e) for e in encoded], out=offsets[1:])
+
+        parsed = _parse_float_buffer(buf, offsets)
+        parsed = np.where(percentages, parsed / 100, parsed)
+        parsed = np.where(negatives, -parsed, parsed)
+        out[string_positions] = parsed
+
+    return pd.Series(out, index=series.index)
+
+
+def _clean_numeric_column_vectorized(series: pd.Series,
+                                     handle_negatives: bool = True) -> pd.Series:
+
+
+    if series.dtype == bool:
+        return pd.Series(series.to_numpy(dtype='float64'), index=series.index)
+
+    if series.dtype == object:
+        series = series.map(lambda v: float(v) if isinstance(v, bool) else v)
+
+    s = series.astype(_STRING_DTYPE).str.strip()
+    s = s.mask(s.str.lower().isin(_MISSING))
+
+
+    if handle_negatives:
+        negative = (s.str.startswith('(') &
+                    s.str.endswith(')')).fillna(False).astype(bool)
+        s = s.str.slice(1, -1).where(negative, s)
+    else:
+        negative = np.zeros(len(series), dtype=bool)
+
+
+    s = s.str.replace(_CURRENCY_RE, '', regex=True)
+
+
+    percentage = s.str.endswith('%').fillna(False).astype(bool)
+    s = s.str.slice(0, -1).where(percentage, s)
+
+    values = pd.to_numeric(s, errors='coerce').astype('float64').to_numpy()
+    values = np.where(percentage, values / 100, values)
+    values = np.where(negative, -values, values)
+
+    return pd.Series(values, index=series.index)
+
+
 def clean_numeric_column(series: pd.Series, handle_negatives: bool = True) -> pd.Series:
-    
-    return series.apply(lambda x: clean_numeric_value(x, handle_negatives))
 
+    if HAS_NUMBA:
+        return _clean_numeric_column_compiled(series, handle_negatives)
+
+    return _clean_numeric_column_vectorized(series, handle_negatives)
+
+
+@lru_cache(maxsize=65536)
+def _standardize_date_str(value_str: str, output_format: str) -> Optional[str]:
 
-def standardize_date(value: Any, output_format: str = '%Y-%m-%d') -> Optional[str]:
-    
-    if pd.isna(value) or value is None:
-        return None
-    
-    
-    if isinstance(value, (datetime, pd.Timestamp)):
-        return value.strftime(output_format)
-    
-    
-    value_str = str(value).strip()
-    
     if not value_str or value_str.lower() in ['n/a', 'na', 'none']:
         return None
     
     
-    date_formats = [
-        '%Y-%m-%d',           
-        '%m/%d/%Y',           
-        '%d/%m/%Y',           
-        '%B %d, %Y',          
-        '%b %d, %Y',          
-        '%Y/%m/%d',           
-        '%d-%m-%Y',           
-        '%Y%m%d',             
-    ]
-    
-    for fmt in date_formats:
+    for pattern, fmt in _DATE_PATTERNS:
+        if not pattern.match(value_str):
+            continue
         try:
-            dt = datetime.strptime(value_str, fmt)
+            if fmt is None:
+
+                dt = datetime(int(value_str[:4]), int(value_str[4:6]),
+                              int(value_str[6:8]))
+            else:
+                dt = datetime.strptime(value_str, fmt)
             return dt.strftime(output_format)
         except ValueError:
             continue
@@ -98,6 +286,50 @@ def standardize_date(value: Any, output_format: str = '%Y-%m-%d') -> Optional[st
         return None
 
 
+def standardize_date(value: Any, output_format: str = '%Y-%m-%d') -> Optional[str]:
+    
+    if pd.isna(value) or value is None:
+        return None
+    
+    
+    if isinstance(value, (datetime, pd.Timestamp)):
+        return value.strftime(output_format)
+    
+    
+    return _standardize_date_str(str(value).strip(), output_format)
+
+
+def standardize_date_column(series: pd.Series,
+                            output_format: str = '%Y-%m-%d') -> pd.Series:
+
+
+    non_null = series.dropna()
+    if non_null.empty:
+        return series.apply(lambda x: standardize_date(x, output_format))
+
+
+    first = str(non_null.iloc[0]).strip()
+    fmt = None
+    for pattern, candidate in _DATE_PATTERNS:
+        if pattern.match(first):
+            fmt = candidate if candidate is not None else '%Y%m%d'
+            break
+
+    if fmt is None:
+        return series.apply(lambda x: standardize_date(x, output_format))
+
+    converted = pd.to_datetime(series, format=fmt, errors='coerce')
+    result = converted.dt.strftime(output_format)
+
+
+    failed = converted.isna() & series.notna()
+    if failed.any():
+        result = result.mask(failed, series[failed].apply(
+            lambda x: standardize_date(x, output_format)))
+
+    return result
+
+
 def handle_thousands_notation(value: float, in_thousands: bool = True) -> float:
     
     if pd.isna(value):
@@ -117,47 +349,67 @@ def remove_empty_rows_cols(df: pd.DataFrame,
         return df
     
     
-    if threshold is not None:
-        df = df.dropna(axis=0, thresh=threshold)
-    else:
-        df = df.dropna(axis=0, how=how)
+    notna = df.notna().to_numpy()
+    if notna.all():
+        return df.reset_index(drop=True)
+    
+    
+    if threshold is None and how == 'all':
+        df = df.loc[notna.any(axis=1), notna.any(axis=0)]
+        return df.reset_index(drop=True)
     
     
     if threshold is not None:
+        df = df.dropna(axis=0, thresh=threshold)
         df = df.dropna(axis=1, thresh=threshold)
     else:
+        df = df.dropna(axis=0, how=how)
         df = df.dropna(axis=1, how=how)
     
     return df.reset_index(drop=True)
 
 
+def _standardize_name(col: Any,
+                      lowercase: bool = True,
+                      replace_spaces: str = '_') -> str:
+
+    col_str = str(col).strip()
+    
+    if lowercase:
+        col_str = col_str.lower()
+    
+    
+    if replace_spaces:
+        col_str = col_str.replace(' ', replace_spaces)
+    
+    
+    col_str = _NON_WORD_RE.sub('', col_str)
+    
+    
+    col_str = _MULTI_UNDERSCORE_RE.sub('_', col_str)
+    
+    
+    return col_str.strip('_')
+
+
 def standardize_column_names(df: pd.DataFrame, 
                              lowercase: bool = True,
                              replace_spaces: str = '_') -> pd.DataFrame:
     
-    new_columns = []
-    for col in df.columns:
-        col_str = str(col).strip()
-        
-        if lowercase:
-            col_str = col_str.lower()
-        
-        
-        if replace_spaces:
-            col_str = col_str.replace(' ', replace_spaces)
-        
-        
-        col_str = re.sub(r'[^\w\s_-]', '', col_str)
-        
-        
-        col_str = re.sub(r'_+', '_', col_str)
-        
-        
-        col_str = col_str.strip('_')
-        
-        new_columns.append(col_str)
+    cols = df.columns.astype(str).str.strip()
     
-    df.columns = new_columns
+    if lowercase:
+        cols = cols.str.lower()
+    
+    
+    if replace_spaces:
+        cols = cols.str.replace(' ', replace_spaces, regex=False)
+    
+    
+    cols = cols.str.replace(_NON_WORD_RE, '', regex=True)
+    cols = cols.str.replace(_MULTI_UNDERSCORE_RE, '_', regex=True)
+    
+    df.columns = cols.str.strip('_').tolist()
     return df
 
 
@@ -179,10 +431,16 @@ def flatten_multi_index_columns(df: pd.DataFrame, separator: str = '_') -> pd.Da
 
 def clean_whitespace(df: pd.DataFrame) -> pd.DataFrame:
     
-    for col in df.columns:
+    for j, dtype in enumerate(df.dtypes):
+        if not pd.api.types.is_string_dtype(dtype):
+            continue
         
-        if pd.api.types.is_object_dtype(df[col]):
-            df[col] = df[col].apply(lambda x: x.strip() if isinstance(x, str) else x)
+        series = df.iloc[:, j]
+        if dtype == object and \
+           pd.api.types.infer_dtype(series, skipna=True) not in _STRIPPABLE_TYPES:
+            continue
+        stripped = series.str.strip()
+        df.iloc[:, j] = stripped.where(stripped.notna(), series)
     
     return df
 
@@ -190,14 +448,22 @@ def clean_whitespace(df: pd.DataFrame) -> pd.DataFrame:
 def identify_header_row(df: pd.DataFrame, 
                        min_non_null_ratio: float = 0.5) -> Optional[int]:
     
-    for idx in range(min(10, len(df))):  
-        row = df.iloc[idx]
-        non_null_ratio = row.notna().sum() / len(row)
+    if df.empty or len(df.columns) == 0:
+        return None
+    
+    
+    arr = df.head(10).to_numpy(dtype=object)
+    width = arr.shape[1]
+    
+    for idx in range(arr.shape[0]):
+        
+        non_null = [val for val in arr[idx] if not pd.isna(val)]
+        if not non_null:
+            continue
         
-        if non_null_ratio >= min_non_null_ratio:
-            
-            string_count = sum(isinstance(val, str) for val in row if pd.notna(val))
-            if string_count / row.notna().sum() > 0.7:
+        if len(non_null) / width >= min_non_null_ratio:
+            string_count = sum(type(val) is str for val in non_null)
+            if string_count / len(non_null) > 0.7:
                 return idx
     
     return None
@@ -207,14 +473,12 @@ def merge_duplicate_columns(df: pd.DataFrame, suffix: str = '_dup') -> pd.DataFr
     
     
     cols = pd.Series(df.columns)
+    counts = cols.groupby(cols).cumcount()
     
-    for dup in cols[cols.duplicated()].unique():
-        
-        dup_indices = [i for i, col in enumerate(df.columns) if col == dup]
-        
-        
-        for i, idx in enumerate(dup_indices[1:], 1):
-            df.columns.values[idx] = f"{dup}{suffix}{i}"
+    mask = counts > 0
+    if mask.any():
+        cols = cols.where(~mask, cols.astype(str) + suffix + counts.astype(str))
+        df.columns = cols.tolist()
     
     return df
 
@@ -231,11 +495,33 @@ def convert_to_proper_types(df: pd.DataFrame,
     if date_cols:
         for col in date_cols:
             if col in df.columns:
-                df[col] = df[col].apply(standardize_date)
+                df[col] = standardize_date_column(df[col])
     
     return df
 
 
+def _clean_low_cardinality(series: pd.Series) -> Optional[pd.Series]:
+
+
+    if len(series) < 20:
+        return None
+
+    nunique = series.nunique(dropna=True)
+    if nunique == 0 or nunique / len(series) >= 0.1:
+        return None
+
+
+    mapping = {value: clean_numeric_value(value)
+               for value in series.dropna().unique()}
+    return series.map(mapping).astype('float64')
+
+
+def _clean_numeric_series(series: pd.Series) -> pd.Series:
+
+    lowcard = _clean_low_cardinality(series)
+    return lowcard if lowcard is not None else clean_numeric_column(series)
+
+
 def clean_financial_table(df: pd.DataFrame,
                          numeric_cols: Optional[list] = None,
                          in_thousands: bool = False) -> pd.DataFrame:
@@ -244,31 +530,65 @@ def clean_financial_table(df: pd.DataFrame,
     df = remove_empty_rows_cols(df)
     
     
-    df = clean_whitespace(df)
-    
-    
-    df = standardize_column_names(df)
-    
-    
-    df = merge_duplicate_columns(df)
-    
-    
-    if numeric_cols:
-        for col in numeric_cols:
-            if col in df.columns:
-                df[col] = clean_numeric_column(df[col])
+    seen = {}
+    cleaned = {}
+    for j, col in enumerate(df.columns):
+        
+        name = _standardize_name(col)
+        count = seen.get(name, 0)
+        seen[name] = count + 1
+        if count:
+            name = f"{name}_dup{count}"
+        
+        series = df.iloc[:, j]
+        
+        
+        if series.dtype == object and \
+           pd.api.types.infer_dtype(series, skipna=True) in _STRIPPABLE_TYPES:
+            stripped = series.str.strip()
+            series = stripped.where(stripped.notna(), series)
+        
+        
+        if numeric_cols:
+            if name in numeric_cols:
+                series = _clean_numeric_series(series)
                 if in_thousands:
-                    df[col] = df[col].apply(lambda x: handle_thousands_notation(x, True))
-    else:
+                    series = series * 1000
+        else:
+            idx = series.first_valid_index()
+            if idx is not None:
+                val = series.loc[idx]
+                if isinstance(val, (int, float)) or \
+                   (isinstance(val, str) and _HAS_DIGIT.search(val)):
+                    series = _clean_numeric_series(series)
         
-        for col in df.columns:
-            
-            sample = df[col].dropna().head(1)
-            if len(sample) > 0:
-                val = sample.iloc[0]
-                if isinstance(val, (int, float)) or (isinstance(val, str) and 
-                    any(c.isdigit() for c in str(val))):
-                    df[col] = clean_numeric_column(df[col])
+        cleaned[name] = series
     
-    return df
+    return pd.DataFrame(cleaned)
+
+
+def clean_financial_tables(tables: dict, in_thousands: bool = False) -> dict:
+
+    groups = {}
+    for key, df in tables.items():
+        groups.setdefault(tuple(str(col) for col in df.columns), []).append(key)
+
+    cleaned = {}
+    for keys in groups.values():
+        if len(keys) == 1:
+            key = keys[0]
+            cleaned[key] = clean_financial_table(tables[key],
+                                                 in_thousands=in_thousands)
+            continue
+
+
+        combined = pd.concat([tables[key].assign(__batch_key__=key)
+                              for key in keys], ignore_index=True)
+        combined = clean_financial_table(combined, in_thousands=in_thousands)
+
+
+        for key, group in combined.groupby('batch_key', sort=False):
+            cleaned[key] = group.drop(columns=['batch_key']).reset_index(drop=True)
+
+    return cleaned
 
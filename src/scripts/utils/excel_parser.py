@@ -1,15 +1,41 @@
 
 
+import numpy as np
 import openpyxl
+import os
 import pandas as pd
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Any
 import re
-from datetime import datetime
+from xml.etree import ElementTree
 
+from openpyxl.utils import range_boundaries
+
+try:
+    from python_calamine import CalamineWorkbook
+    HAS_CALAMINE = True
+except ImportError:
+    HAS_CALAMINE = False
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+_FORM_DATE_RE = re.compile(r'\(([^)]+)\)\s+(\d{4}-\d{2}-\d{2})')
+_DATE_RE = re.compile(r'(\d{4}-\d{2}-\d{2})')
+_TICKER_RE = re.compile(r'^([A-Z]+)\s+\(([^)]+)\)')
+
+
+@lru_cache(maxsize=256)
+def _cached_filing_metadata(file_path: str, mtime_ns: int) -> Dict[str, str]:
 
-def get_filing_metadata(file_path: str) -> Dict[str, str]:
-    
     filename = Path(file_path).stem
     
     metadata = {
@@ -18,76 +44,311 @@ def get_filing_metadata(file_path: str) -> Dict[str, str]:
     }
     
     
-    date_match = re.search(r'(\d{4}-\d{2}-\d{2})', filename)
-    if date_match:
-        metadata['filing_date'] = date_match.group(1)
-    
-    
-    form_match = re.search(r'\(([^)]+)\)\s+\d{4}-\d{2}-\d{2}', filename)
-    if form_match:
-        metadata['form_code'] = form_match.group(1)
+    form_date_match = _FORM_DATE_RE.search(filename)
+    if form_date_match:
+        metadata['form_code'] = form_date_match.group(1)
+        metadata['filing_date'] = form_date_match.group(2)
+    else:
+        date_match = _DATE_RE.search(filename)
+        if date_match:
+            metadata['filing_date'] = date_match.group(1)
     
     
-    ticker_match = re.search(r'^([A-Z]+)\s+\(([^)]+)\)', filename)
+    ticker_match = _TICKER_RE.search(filename)
     if ticker_match:
         metadata['ticker'] = ticker_match.group(1)
         metadata['company'] = ticker_match.group(2)
-    
+
     return metadata
 
 
-def read_excel_with_merged_cells(file_path: str, sheet_name: str, 
+def _mtime_ns(file_path: str) -> int:
+
+    try:
+        return os.stat(file_path).st_mtime_ns
+    except OSError:
+        return 0
+
+
+_WORKBOOK_CACHE: Dict[Tuple[str, int], Any] = {}
+
+
+def open_workbook_cached(file_path: str):
+
+
+    file_path = str(file_path)
+    key = (file_path, _mtime_ns(file_path))
+    workbook = _WORKBOOK_CACHE.get(key)
+    if workbook is None:
+        workbook = openpyxl.load_workbook(file_path, data_only=True, read_only=True)
+        _WORKBOOK_CACHE[key] = workbook
+    return workbook
+
+
+def close_cached_workbooks() -> None:
+
+    while _WORKBOOK_CACHE:
+        _, workbook = _WORKBOOK_CACHE.popitem()
+        try:
+            workbook.close()
+        except Exception:
+            pass
+
+
+def get_filing_metadata(file_path: str) -> Dict[str, str]:
+
+
+    file_path = str(file_path)
+    return dict(_cached_filing_metadata(file_path, _mtime_ns(file_path)))
+
+
+def read_worksheet_with_merged_cells(ws, fill_merged: bool = True) -> pd.DataFrame:
+
+
+    data = [list(row) for row in ws.iter_rows(values_only=True)]
+
+    if not data:
+        return pd.DataFrame()
+
+
+    for merged_range in ws.merged_cells.ranges:
+        min_row, min_col = merged_range.min_row, merged_range.min_col
+        if min_row > len(data) or min_col > len(data[min_row - 1]):
+            continue
+        master = data[min_row - 1][min_col - 1] if fill_merged else None
+        for r in range(min_row - 1, min(merged_range.max_row, len(data))):
+            row_data = data[r]
+            for c in range(min_col - 1, min(merged_range.max_col, len(row_data))):
+                if r == min_row - 1 and c == min_col - 1:
+                    continue
+                row_data[c] = master
+
+    return pd.DataFrame(data)
+
+
+_XLSX_MAIN_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+_XLSX_REL_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+_XLSX_REL_ID = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id'
+
+
+def _sheet_targets(archive) -> List[Tuple[str, str]]:
+
+
+    workbook_root = ElementTree.fromstring(archive.read('xl/workbook.xml'))
+    rels_root = ElementTree.fromstring(archive.read('xl/_rels/workbook.xml.rels'))
+
+    targets = {rel.get('Id'): rel.get('Target')
+               for rel in rels_root.iter(f'{_XLSX_REL_NS}Relationship')}
+
+    sheets = []
+    for sheet in workbook_root.iter(f'{_XLSX_MAIN_NS}sheet'):
+        target = targets.get(sheet.get(_XLSX_REL_ID))
+        if target is None:
+            continue
+        if not target.startswith('xl/'):
+            target = 'xl/' + target.lstrip('/')
+        sheets.append((sheet.get('name'), target))
+
+    return sheets
+
+
+def _merged_ranges_from_xml(file_path: str, sheet_name: str) -> List[Tuple[int, int, int, int]]:
+
+
+    try:
+        with zipfile.ZipFile(file_path) as archive:
+            sheet_target = next((target for name, target in _sheet_targets(archive)
+                                 if name == sheet_name), None)
+            if sheet_target is None:
+                return []
+
+            sheet_root = ElementTree.fromstring(archive.read(sheet_target))
+            return [range_boundaries(merge.get('ref'))
+                    for merge in sheet_root.iter(f'{_XLSX_MAIN_NS}mergeCell')]
+    except (OSError, KeyError, ElementTree.ParseError):
+        return []
+
+
+def _fill_merged_regions(data, ranges) -> None:
+
+    for min_col, min_row, max_col, max_row in ranges:
+        if min_row > len(data) or min_col > len(data[min_row - 1]):
+            continue
+        master = data[min_row - 1][min_col - 1]
+        for r in range(min_row - 1, min(max_row, len(data))):
+            for c in range(min_col - 1, min(max_col, len(data[r]))):
+                data[r][c] = master
+
+
+def read_excel_with_merged_cells(file_path: str, sheet_name: str,
                                   fill_merged: bool = True) -> pd.DataFrame:
-    
-    wb = openpyxl.load_workbook(file_path, data_only=True)
-    ws = wb[sheet_name]
-    
-    
-    data = []
-    for row in ws.iter_rows(values_only=False):
-        row_data = []
-        for cell in row:
-            if isinstance(cell, openpyxl.cell.cell.MergedCell):
-                
-                for merged_range in ws.merged_cells.ranges:
-                    if cell.coordinate in merged_range:
-                        
-                        master_cell = ws.cell(merged_range.min_row, merged_range.min_col)
-                        row_data.append(master_cell.value if fill_merged else None)
-                        break
-            else:
-                row_data.append(cell.value)
-        data.append(row_data)
-    
-    wb.close()
-    
-    
-    if data:
-        df = pd.DataFrame(data)
+
+
+    if HAS_CALAMINE:
+        sheet = CalamineWorkbook.from_path(file_path).get_sheet_by_name(sheet_name)
+        data = [[None if value == '' else value for value in row]
+                for row in sheet.to_python(skip_empty_area=False)]
     else:
-        df = pd.DataFrame()
-    
-    return df
+        wb = openpyxl.load_workbook(file_path, data_only=True, read_only=True)
+        try:
+            data = [list(row) for row in wb[sheet_name].iter_rows(values_only=True)]
+        finally:
+            wb.close()
+
+    if not data:
+        return pd.DataFrame()
+
+    if fill_merged:
+        _fill_merged_regions(data, _merged_ranges_from_xml(file_path, sheet_name))
+
+    return pd.DataFrame(data).convert_dtypes()
+
+
+class ExcelSource:
+
+
+    def __init__(self, file_path: str):
+        self.file_path = str(file_path)
+        self._workbook = openpyxl.load_workbook(self.file_path, data_only=True,
+                                                read_only=True)
+        self._merged_ranges: Dict[str, List[Tuple[int, int, int, int]]] = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self) -> None:
+        self._workbook.close()
+
+    def sheet_names(self) -> List[str]:
+        return list(self._workbook.sheetnames)
+
+    def find_sheets(self, keywords: List[str],
+                    case_sensitive: bool = False) -> List[str]:
+        return match_sheets_by_keyword(self.sheet_names(), keywords,
+                                       case_sensitive)
+
+    def read_sheet(self, sheet_name: str, fill_merged: bool = True) -> pd.DataFrame:
+
+        data = [list(row)
+                for row in self._workbook[sheet_name].iter_rows(values_only=True)]
+
+        if not data:
+            return pd.DataFrame()
+
+        if fill_merged:
+            ranges = self._merged_ranges.get(sheet_name)
+            if ranges is None:
+                ranges = _merged_ranges_from_xml(self.file_path, sheet_name)
+                self._merged_ranges[sheet_name] = ranges
+            _fill_merged_regions(data, ranges)
+
+        return pd.DataFrame(data)
+
+
+def list_sheet_names_lower(workbook) -> List[Tuple[str, str]]:
+
+    return [(name, name.lower()) for name in workbook.sheetnames]
+
+
+def match_sheets_by_keyword(sheet_names: List[str],
+                            keywords: List[str],
+                            case_sensitive: bool = False) -> List[str]:
+
+    pattern = re.compile('|'.join(map(re.escape, keywords)),
+                         0 if case_sensitive else re.IGNORECASE)
+
+    return [sheet_name for sheet_name in sheet_names
+            if pattern.search(sheet_name)]
+
+
+def index_sheets_by_keyword(sheet_names_lower: List[Tuple[str, str]],
+                            keywords: List[str]) -> Dict[str, set]:
+
+    lowered_keywords = [k.lower() for k in keywords]
+
+    sheet_hits = {}
+    for sheet_name, sheet_lower in sheet_names_lower:
+        sheet_hits[sheet_name] = {k for k in lowered_keywords if k in sheet_lower}
+
+    return sheet_hits
+
+
+def match_sheets_from_index(sheet_hits: Dict[str, set],
+                            keywords: List[str]) -> List[str]:
+
+    wanted = {k.lower() for k in keywords}
+    return [sheet for sheet, hits in sheet_hits.items() if hits & wanted]
+
+
+def first_sheet_from_index(sheet_hits: Dict[str, set],
+                           keywords: List[str],
+                           exclude: Tuple[str, ...] = ()) -> Optional[str]:
 
+    wanted = {k.lower() for k in keywords}
+    excluded = [e.lower() for e in exclude]
 
-def find_sheets_by_keyword(file_path: str, keywords: List[str], 
+    for sheet, hits in sheet_hits.items():
+        if hits & wanted:
+            sheet_lower = sheet.lower()
+            if not any(e in sheet_lower for e in excluded):
+                return sheet
+
+    return None
+
+
+def find_first_sheet_by_keyword(file_path: str, keywords: List[str],
+                                exclude: Tuple[str, ...] = ()) -> Optional[str]:
+
+    lowered_keywords = [k.lower() for k in keywords]
+    excluded = [e.lower() for e in exclude]
+
+    for sheet_name in get_sheet_names(file_path):
+        sheet_lower = sheet_name.lower()
+        if any(k in sheet_lower for k in lowered_keywords) and \
+           not any(e in sheet_lower for e in excluded):
+            return sheet_name
+
+    return None
+
+
+def find_sheets_by_keyword(file_path: str, keywords: List[str],
                            case_sensitive: bool = False) -> List[str]:
-    
-    wb = openpyxl.load_workbook(file_path, data_only=True, read_only=True)
-    sheet_names = wb.sheetnames
-    wb.close()
-    
-    matching_sheets = []
-    for sheet_name in sheet_names:
-        for keyword in keywords:
-            search_name = sheet_name if case_sensitive else sheet_name.lower()
-            search_keyword = keyword if case_sensitive else keyword.lower()
-            
-            if search_keyword in search_name:
-                matching_sheets.append(sheet_name)
-                break
-    
-    return matching_sheets
+
+    return match_sheets_by_keyword(get_sheet_names(file_path),
+                                   keywords, case_sensitive)
+
+
+if HAS_NUMBA:
+    @njit(cache=True, nogil=True)
+    def _table_bounds(mask, min_non_null):
+
+        n_rows, n_cols = mask.shape
+        first_row, last_row = -1, -1
+        for r in range(n_rows):
+            count = 0
+            for c in range(n_cols):
+                if mask[r, c]:
+                    count += 1
+            if count >= min_non_null:
+                if first_row < 0:
+                    first_row = r
+                last_row = r
+
+        first_col, last_col = -1, -1
+        for c in range(n_cols):
+            count = 0
+            for r in range(n_rows):
+                if mask[r, c]:
+                    count += 1
+            if count >= min_non_null:
+                if first_col < 0:
+                    first_col = c
+                last_col = c
+
+        return first_row, last_row, first_col, last_col
 
 
 def detect_table_boundaries(df: pd.DataFrame, 
@@ -97,38 +358,47 @@ def detect_table_boundaries(df: pd.DataFrame,
         return (0, 0, 0, 0)
     
     
-    row_has_data = df.notna().sum(axis=1) >= min_non_null
-    rows_with_data = row_has_data[row_has_data].index.tolist()
-    
-    if not rows_with_data:
+    notna = df.notna().to_numpy()
+
+    if HAS_NUMBA:
+        first_row, last_row, first_col, last_col = _table_bounds(
+            np.ascontiguousarray(notna), min_non_null)
+        if first_row < 0:
+            return (0, 0, 0, 0)
+        if first_col < 0:
+            return (first_row, last_row, 0, 0)
+        return (first_row, last_row, first_col, last_col)
+
+    row_ok = notna.sum(axis=1) >= min_non_null
+    if not row_ok.any():
         return (0, 0, 0, 0)
-    
-    start_row = min(rows_with_data)
-    end_row = max(rows_with_data)
-    
-    
-    col_has_data = df.notna().sum(axis=0) >= min_non_null
-    cols_with_data = col_has_data[col_has_data].index.tolist()
-    
-    if not cols_with_data:
+    start_row = int(np.argmax(row_ok))
+    end_row = len(row_ok) - 1 - int(np.argmax(row_ok[::-1]))
+
+    col_ok = notna.sum(axis=0) >= min_non_null
+    if not col_ok.any():
         return (start_row, end_row, 0, 0)
-    
-    start_col = min(cols_with_data)
-    end_col = max(cols_with_data)
-    
+    start_col = int(np.argmax(col_ok))
+    end_col = len(col_ok) - 1 - int(np.argmax(col_ok[::-1]))
+
     return (start_row, end_row, start_col, end_col)
 
 
-def extract_table_from_sheet(file_path: str, sheet_name: str,
-                             header_rows: int = 1,
-                             skip_empty_rows: bool = True) -> pd.DataFrame:
-    
-    
-    df = read_excel_with_merged_cells(file_path, sheet_name)
-    
-    if df.empty:
-        return df
-    
+def table_has_data(df: pd.DataFrame, min_rows: int = 1) -> bool:
+
+    return not df.empty and df.dropna(how='all').shape[0] >= min_rows
+
+
+def extract_table_from_worksheet(ws, header_rows: int = 1,
+                                 skip_empty_rows: bool = True) -> pd.DataFrame:
+
+
+    df = read_worksheet_with_merged_cells(ws)
+
+
+    if df.empty or df.dropna(how='all').shape[0] <= header_rows:
+        return pd.DataFrame()
+
     
     start_row, end_row, start_col, end_col = detect_table_boundaries(df)
     
@@ -141,16 +411,19 @@ def extract_table_from_sheet(file_path: str, sheet_name: str,
     
     if header_rows > 0 and len(df) > header_rows:
         if header_rows == 1:
-            df.columns = df.iloc[0]
-            df = df.iloc[1:].reset_index(drop=True)
+            cols = pd.Index(list(df.iloc[0].values))
+            df = df.iloc[1:].copy()
+            df.index = pd.RangeIndex(len(df))
+            df.columns = cols
         else:
             
-            header = df.iloc[:header_rows]
+            header = df.iloc[:header_rows].to_numpy(dtype=object)
             
             new_cols = []
-            for col in df.columns:
-                col_headers = [str(h) if pd.notna(h) else '' for h in header[col]]
-                combined = ' '.join([h for h in col_headers if h]).strip()
+            for j, col in enumerate(df.columns):
+                parts = [str(val) for val in header[:, j]
+                         if not pd.isna(val)]
+                combined = ' '.join(part for part in parts if part).strip()
                 new_cols.append(combined if combined else f'Column_{col}')
             df.columns = new_cols
             df = df.iloc[header_rows:].reset_index(drop=True)
@@ -158,27 +431,76 @@ def extract_table_from_sheet(file_path: str, sheet_name: str,
     
     if skip_empty_rows:
         df = df.dropna(how='all').reset_index(drop=True)
-    
+
     return df
 
 
+def extract_table_from_sheet(file_path: str, sheet_name: str,
+                             header_rows: int = 1,
+                             skip_empty_rows: bool = True) -> pd.DataFrame:
+
+    wb = openpyxl.load_workbook(file_path, data_only=True)
+    try:
+        return extract_table_from_worksheet(wb[sheet_name], header_rows=header_rows,
+                                            skip_empty_rows=skip_empty_rows)
+    finally:
+        wb.close()
+
+
+def extract_tables_bulk(file_paths: List[str], sheet_name: str,
+                        **kwargs) -> List[pd.DataFrame]:
+
+
+    file_paths = [str(path) for path in file_paths]
+
+    if len(file_paths) <= 1:
+        return [extract_table_from_sheet(path, sheet_name, **kwargs)
+                for path in file_paths]
+
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        return list(executor.map(
+            partial(extract_table_from_sheet, sheet_name=sheet_name, **kwargs),
+            file_paths, chunksize=8))
+
+
 def get_all_sheets_info(file_path: str) -> List[Dict[str, Any]]:
     
-    wb = openpyxl.load_workbook(file_path, data_only=True, read_only=True)
-    
-    sheets_info = []
-    for sheet_name in wb.sheetnames:
-        ws = wb[sheet_name]
-        info = {
-            'sheet_name': sheet_name,
-            'dimensions': ws.dimensions,
-            'max_row': ws.max_row,
-            'max_column': ws.max_column
-        }
-        sheets_info.append(info)
-    
-    wb.close()
-    return sheets_info
+    try:
+        with zipfile.ZipFile(file_path) as archive:
+            sheets_info = []
+            for sheet_name, target in _sheet_targets(archive):
+                dimensions = None
+                with archive.open(target) as fh:
+                    for _, elem in ElementTree.iterparse(fh, events=('start',)):
+                        if elem.tag == f'{_XLSX_MAIN_NS}dimension':
+                            dimensions = elem.get('ref')
+                            break
+                        if elem.tag == f'{_XLSX_MAIN_NS}sheetData':
+                            break
+
+                info = {
+                    'sheet_name': sheet_name,
+                    'dimensions': dimensions,
+                    'max_row': None,
+                    'max_column': None
+                }
+                if dimensions:
+                    _, _, max_col, max_row = range_boundaries(dimensions)
+                    info['max_row'] = max_row
+                    info['max_column'] = max_col
+                sheets_info.append(info)
+
+            return sheets_info
+    except (OSError, KeyError, ElementTree.ParseError):
+        pass
+
+
+    wb = open_workbook_cached(file_path)
+    return [{'sheet_name': sheet_name,
+             'dimensions': wb[sheet_name].dimensions,
+             'max_row': wb[sheet_name].max_row,
+             'max_column': wb[sheet_name].max_column}
+            for sheet_name in wb.sheetnames]
 
 
 def extract_multi_level_headers(df: pd.DataFrame, 
@@ -187,28 +509,55 @@ def extract_multi_level_headers(df: pd.DataFrame,
     if len(df) < header_rows:
         return df
     
-    header_data = df.iloc[:header_rows]
+    header_data = df.iloc[:header_rows].to_numpy(dtype=object)
     new_columns = []
     
-    for col in df.columns:
+    for j, col in enumerate(df.columns):
         parts = []
         for i in range(header_rows):
-            val = header_data.iloc[i][col]
-            if pd.notna(val) and str(val).strip():
+            val = header_data[i, j]
+            if not pd.isna(val) and str(val).strip():
                 parts.append(str(val).strip())
         
         combined = ' - '.join(parts) if parts else f'Column_{col}'
         new_columns.append(combined)
     
     df.columns = new_columns
-    df = df.iloc[header_rows:].reset_index(drop=True)
+    df = df.iloc[header_rows:]
+    df.index = pd.RangeIndex(len(df))
     
     return df
 
 
+def _read_sheet_window(file_path: str, sheet_name: str,
+                       skiprows: int, nrows: int) -> pd.DataFrame:
+
+
+    wb = openpyxl.load_workbook(file_path, data_only=True, read_only=True)
+    try:
+        rows = wb[sheet_name].iter_rows(min_row=skiprows + 1,
+                                        max_row=skiprows + nrows + 1,
+                                        values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return pd.DataFrame()
+        return pd.DataFrame(list(rows), columns=header)
+    finally:
+        wb.close()
+
+
 def safe_read_excel(file_path: str, sheet_name: str, **kwargs) -> Optional[pd.DataFrame]:
-    
+
+    if HAS_CALAMINE:
+        kwargs.setdefault('engine', 'calamine')
+
     try:
+        if not HAS_CALAMINE and isinstance(kwargs.get('nrows'), int) and \
+           isinstance(kwargs.get('skiprows', 0), int) and \
+           not kwargs.keys() - {'nrows', 'skiprows'}:
+            return _read_sheet_window(file_path, sheet_name,
+                                      kwargs.get('skiprows', 0), kwargs['nrows'])
+
         df = pd.read_excel(file_path, sheet_name=sheet_name, **kwargs)
         return df
     except Exception as e:
@@ -216,14 +565,41 @@ def safe_read_excel(file_path: str, sheet_name: str, **kwargs) -> Optional[pd.Da
         return None
 
 
-def get_sheet_names(file_path: str) -> List[str]:
-    
+@lru_cache(maxsize=256)
+def _cached_sheet_names(file_path: str, mtime_ns: int) -> Tuple[str, ...]:
+
     try:
-        wb = openpyxl.load_workbook(file_path, data_only=True, read_only=True)
-        names = wb.sheetnames
-        wb.close()
-        return names
+        if HAS_CALAMINE:
+            return tuple(CalamineWorkbook.from_path(file_path).sheet_names)
+
+        return tuple(open_workbook_cached(file_path).sheetnames)
     except Exception as e:
         print(f"Error getting sheet names from {file_path}: {e}")
-        return []
+        return ()
+
+
+def get_sheet_names(file_path: str) -> List[str]:
+
+
+    file_path = str(file_path)
+    return list(_cached_sheet_names(file_path, _mtime_ns(file_path)))
+
+
+def prefetch_workbooks(paths, max_workers: int = 2):
+
+
+    paths = list(paths)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque(executor.submit(openpyxl.load_workbook, str(path),
+                                        data_only=True)
+                        for path in paths[:max_workers])
+
+        for i, path in enumerate(paths):
+            next_index = i + max_workers
+            if next_index < len(paths):
+                pending.append(executor.submit(openpyxl.load_workbook,
+                                               str(paths[next_index]),
+                                               data_only=True))
+
+            yield path, pending.popleft()
 
@@ -0,0 +1,101 @@
+
+
+import fnmatch
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+_loaded_indexes: Dict[str, Dict] = {}
+
+
+def _cache_file(root: Path) -> Path:
+    return root / '.cache' / 'file_index.json'
+
+
+def iter_xlsx(root, name_substr: str = None) -> Iterator[str]:
+
+
+    stack = [str(root)]
+    while stack:
+        for entry in os.scandir(stack.pop()):
+            if entry.is_dir(follow_symlinks=False):
+                stack.append(entry.path)
+            elif entry.name.endswith('.xlsx') and \
+                    (name_substr is None or name_substr in entry.name):
+                yield entry.path
+
+
+def _dir_mtimes(root) -> Dict[str, float]:
+
+
+    mtimes = {}
+    stack = [str(root)]
+    while stack:
+        dirpath = stack.pop()
+        mtimes[dirpath] = os.stat(dirpath).st_mtime
+        for entry in os.scandir(dirpath):
+            if entry.is_dir(follow_symlinks=False):
+                stack.append(entry.path)
+
+    return mtimes
+
+
+def build_index(root) -> Dict:
+
+    return {'dir_mtimes': _dir_mtimes(root), 'files': sorted(iter_xlsx(root))}
+
+
+def save_index(root, index: Dict) -> None:
+
+    cache_file = _cache_file(Path(root))
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps(index))
+    except OSError:
+        pass
+
+
+def load_index(root) -> Dict:
+
+    root = Path(root)
+    key = str(root)
+    current_mtimes = _dir_mtimes(root)
+
+    index = _loaded_indexes.get(key)
+    if index is not None and index['dir_mtimes'] == current_mtimes:
+        return index
+
+
+    index = None
+    cache_file = _cache_file(root)
+    if cache_file.exists():
+        try:
+            index = json.loads(cache_file.read_text())
+        except (OSError, ValueError):
+            index = None
+
+    if index is None or index.get('dir_mtimes') != current_mtimes:
+        index = build_index(root)
+        save_index(root, index)
+
+    _loaded_indexes[key] = index
+    return index
+
+
+def find_files(input_dir: str, pattern: str) -> List[Path]:
+
+
+    input_path = Path(input_dir)
+    if not input_path.is_dir():
+        return []
+
+    try:
+        index = load_index(input_path.parent)
+    except OSError:
+        return sorted(Path(p) for p in iter_xlsx(input_path)
+                      if fnmatch.fnmatch(os.path.basename(p), pattern))
+
+    prefix = str(input_path) + os.sep
+    return [Path(p) for p in index['files']
+            if p.startswith(prefix) and fnmatch.fnmatch(os.path.basename(p), pattern)]
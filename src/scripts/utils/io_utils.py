@@ -0,0 +1,90 @@
+
+
+import os
+from pathlib import Path
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+
+USE_PARQUET = os.environ.get('EXTRACTION_PARQUET', '').lower() in ('1', 'true', 'yes')
+
+WRITE_BUFFER_SIZE = 4 * 1024 * 1024
+
+
+def advise_willneed(paths) -> None:
+
+
+    if not hasattr(os, 'posix_fadvise'):
+        return
+
+    for path in paths:
+        try:
+            fd = os.open(str(path), os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            finally:
+                os.close(fd)
+        except OSError:
+            continue
+
+
+def write_parquet(df: pd.DataFrame, output_file: str) -> None:
+
+    if HAS_PYARROW:
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+
+            table = pa.Table.from_pandas(df.astype(str), preserve_index=False)
+        pq.write_table(table, output_file)
+        return
+
+
+    df.to_parquet(output_file, index=False)
+
+
+def write_csv(df: pd.DataFrame, output_file: str) -> None:
+
+    if USE_PARQUET:
+        write_parquet(df, str(Path(output_file).with_suffix('.parquet')))
+        return
+
+    if HAS_PYARROW:
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            pacsv.write_csv(table, output_file)
+            return
+        except (ValueError, pa.ArrowInvalid, pa.ArrowTypeError,
+                pa.ArrowNotImplementedError):
+            pass
+
+
+    with open(output_file, 'wb', buffering=WRITE_BUFFER_SIZE) as fh:
+        df.to_csv(fh, index=False)
+
+
+def write_csv_with_constants(df: pd.DataFrame, constants: dict,
+                             output_file: str) -> None:
+
+
+    if HAS_PYARROW and not USE_PARQUET:
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            for name, value in constants.items():
+                table = table.append_column(name, pa.array([value] * len(df)))
+            pacsv.write_csv(table, output_file)
+            return
+        except (ValueError, pa.ArrowInvalid, pa.ArrowTypeError,
+                pa.ArrowNotImplementedError):
+            pass
+
+
+    write_csv(df.assign(**constants), output_file)
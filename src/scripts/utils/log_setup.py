@@ -0,0 +1,29 @@
+
+
+import logging
+import multiprocessing
+from logging.handlers import QueueHandler, QueueListener
+
+
+def setup_queue_logging(level: int = logging.INFO) -> QueueListener:
+
+
+    queue = multiprocessing.Queue()
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter('%(message)s'))
+
+    listener = QueueListener(queue, stream_handler)
+    listener.start()
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.handlers.clear()
+    root.addHandler(QueueHandler(queue))
+
+    return listener
+
+
+def setup_basic_logging(level: int = logging.INFO) -> None:
+
+    logging.basicConfig(level=level, format='%(message)s')
@@ -0,0 +1,55 @@
+
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, Optional
+
+from utils.file_index import iter_xlsx
+
+CACHE_VERSION = 1
+
+
+def file_sha256(path, chunk_size: int = 1 << 20) -> str:
+
+    digest = hashlib.sha256()
+    with open(path, 'rb') as fh:
+        for chunk in iter(lambda: fh.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def directory_signature(input_dir) -> Dict[str, str]:
+
+
+    try:
+        return {path: file_sha256(path) for path in sorted(iter_xlsx(input_dir))}
+    except OSError:
+        return {}
+
+
+def _entry_file(cache_dir, key: str) -> Path:
+    return Path(cache_dir) / '.parse_cache' / f'{key}.json'
+
+
+def load_entry(cache_dir, key: str) -> Optional[Dict]:
+
+    try:
+        entry = json.loads(_entry_file(cache_dir, key).read_text())
+    except (OSError, ValueError):
+        return None
+
+    if entry.get('version') != CACHE_VERSION:
+        return None
+
+    return entry
+
+
+def save_entry(cache_dir, key: str, entry: Dict) -> None:
+
+    entry_file = _entry_file(cache_dir, key)
+    try:
+        entry_file.parent.mkdir(parents=True, exist_ok=True)
+        entry_file.write_text(json.dumps({'version': CACHE_VERSION, **entry}))
+    except OSError:
+        pass
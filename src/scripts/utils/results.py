@@ -0,0 +1,31 @@
+
+
+from dataclasses import dataclass, field, asdict
+from typing import Any, Dict, List, Optional
+
+
+@dataclass(slots=True)
+class FilingResult:
+
+
+    status: str
+    file: Optional[str] = None
+    error: Optional[str] = None
+    message: Optional[str] = None
+    metadata: Optional[Dict] = None
+    person_info: Optional[Dict] = None
+    files_created: List[str] = field(default_factory=list)
+    nonderivative_file: Optional[str] = None
+    derivative_file: Optional[str] = None
+
+    def get(self, key: str, default: Any = None) -> Any:
+
+
+        value = getattr(self, key, default)
+        return default if value is None else value
+
+    def to_dict(self) -> Dict:
+
+
+        return {key: value for key, value in asdict(self).items()
+                if value is not None and value != []}